@@ -0,0 +1,306 @@
+"""
+Headless rerun benchmark for every view of the dashboard.
+
+Drives test.py through Streamlit's AppTest and times repeated reruns of
+each view: the landing survey, the SDG map for each of the 17 SDGs, the
+Indicator Dashboard per indicator, Electricity Loss, Brazil Germany
+Comparison, Data Availability and Results. For every view it reports the
+p50/p95 rerun latency, the peak RSS and the bytes of the ForwardMsgs sent
+to the browser per rerun (media files such as the SDG icons are served
+separately and not counted). Each view runs in its own interpreter, so its
+peak RSS is not inflated by the views before it.
+
+    python benchmarks/bench_pages.py                   # run and compare
+    python benchmarks/bench_pages.py --save-baseline   # store a new baseline
+    python benchmarks/bench_pages.py --data-dir /tmp/sdg-data   # other raw data
+    python benchmarks/bench_pages.py --bundle          # the built bundle/ (or SDG_BUNDLE_DIR)
+
+By default the views read a fixed-seed synthetic dataset (SYNTH_DATA, see
+sdg_dashboard/synth.py), compiled into a bundle in a temporary directory.
+The repository's own ``Data/`` lacks the SDR workbook and Goal7, so the SDG
+map and indicator views would only time their error pages. The committed
+baseline (benchmarks/baseline.json) was recorded from the synthetic data.
+
+The baseline stores the data it was recorded on (the synth parameters, or
+the bundle version for other data); results of other data are not compared
+with it. A view regresses when a metric exceeds its baseline by more than
+the tolerance (default 20%). A view that raises or shows an error fails;
+it is neither compared nor saved into a baseline. The exit code is 1 if a
+view regressed or failed.
+"""
+
+import argparse
+import json
+import os
+import resource
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SCRIPT_PATH = os.path.join(REPO_ROOT, "test.py")
+BASELINE_PATH = os.path.join(REPO_ROOT, "benchmarks", "baseline.json")
+
+METRICS = ("p50_ms", "p95_ms", "payload_bytes", "peak_rss_mb")
+
+# Default benchmark data: arguments of sdg_dashboard.synth.generate
+SYNTH_DATA = {"geo_areas": 300, "years": 20, "indicators": 102, "missing_rate": 0.1, "seed": 0}
+
+sys.path.insert(0, REPO_ROOT)
+os.environ.setdefault("SDG_WARMUP", "0")  # Keep the background warm-up out of the timings
+os.environ.setdefault("SDG_WATCH", "0")  # Data does not change during a run
+
+from streamlit.testing.v1 import AppTest  # noqa: E402
+from streamlit.testing.v1 import local_script_runner  # noqa: E402
+
+# Size of the messages of the latest script run, recorded by the hook below
+_last_payload = {"bytes": 0}
+_parse_tree_from_messages = local_script_runner.parse_tree_from_messages
+
+
+def _measure_payload(messages):
+    _last_payload["bytes"] = sum(message.ByteSize() for message in messages)
+    return _parse_tree_from_messages(messages)
+
+
+local_script_runner.parse_tree_from_messages = _measure_payload
+
+
+def _click(at, label):
+    for button in at.button:
+        if button.label == label:
+            button.click()
+            return
+    raise LookupError(f"Button {label!r} not found")
+
+
+def _new_app(**state):
+    at = AppTest.from_file(SCRIPT_PATH, default_timeout=120)
+    for key, value in state.items():
+        at.session_state[key] = value
+    return at
+
+
+def _sidebar_view(choice, prepare=None):
+    def setup():
+        at = _new_app(page="dashboards").run()
+        return at.sidebar.radio[0].set_value(choice).run()
+
+    return setup, prepare
+
+
+def _indicator_prepare(indicator):
+    def prepare(at):
+        at.sidebar.selectbox[0].set_value(indicator)
+        _click(at, "Generate Indicator Graph")
+
+    return prepare
+
+
+def _indicators():
+    from sdg_dashboard import registry
+
+    goal7_data = registry.get("goal7")
+    if goal7_data is None:  # Not in the bundle: no indicator views to time
+        return []
+    return sorted(goal7_data["Indicator"].dropna().str.strip().unique())
+
+
+def views(indicators=None):
+    """
+    Returns {view name: (setup, prepare)}; prepare runs before every timed
+    rerun. indicators defaults to all indicators of the goal7 dataset.
+    """
+    result = {"survey": (lambda: _new_app(), None)}
+    for i in range(17):
+        result[f"sdg_map/SDG {i + 1}"] = (
+            lambda i=i: _new_app(page="sdg_map", selected_sdg_index=i),
+            None,
+        )
+    for indicator in _indicators() if indicators is None else indicators:
+        result[f"indicator/{indicator}"] = _sidebar_view(
+            "Indicator Dashboard", _indicator_prepare(indicator)
+        )
+    result["electricity_loss"] = _sidebar_view(
+        "Electricity Loss Comparison", lambda at: _click(at, "Generate Comparison")
+    )
+    result["brazil_germany"] = _sidebar_view("Brazil Germany Comparison")
+    result["data_availability"] = _sidebar_view("Data Availability")
+    result["results"] = (lambda: _new_app(page="results"), None)
+    return result
+
+
+def _percentile(values, q):
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(q * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def peak_rss_mb():
+    """Peak RSS of this process. ru_maxrss survives fork and exec on Linux, so it
+    would report the parent's peak; VmHWM is the peak of this process' own memory."""
+    try:
+        with open("/proc/self/status") as file:
+            for line in file:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def bench_view(setup, prepare, runs):
+    at = setup()
+    if prepare:
+        prepare(at)
+    at.run()  # Fill the caches; not timed
+
+    timings = []
+    for _ in range(runs):
+        if prepare:
+            prepare(at)
+        started = time.perf_counter()
+        at.run()
+        timings.append((time.perf_counter() - started) * 1000)
+
+    return {
+        "p50_ms": round(statistics.median(timings), 2),
+        "p95_ms": round(_percentile(timings, 0.95), 2),
+        "payload_bytes": _last_payload["bytes"],
+        "peak_rss_mb": round(peak_rss_mb(), 1),
+        "exceptions": [exception.message for exception in at.exception],
+        "errors": [error.value for error in at.error],
+    }
+
+
+def bench_view_isolated(name, runs):
+    """bench_view of one view in a fresh interpreter (with this process' environment)."""
+    completed = subprocess.run(
+        [sys.executable, os.path.abspath(__file__), "--view", name, "--runs", str(runs)],
+        cwd=REPO_ROOT, capture_output=True, text=True,
+    )
+    if completed.returncode != 0:
+        lines = completed.stderr.strip().splitlines()
+        raise RuntimeError(lines[-1] if lines else f"exit code {completed.returncode}")
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def compare(results, baseline, tolerance, data):
+    """
+    Returns a list of (view, metric, baseline value, new value) regressions.
+    Raises ValueError if the baseline was recorded on other data than data.
+    """
+    if baseline.get("data") != data:
+        raise ValueError(f"Baseline recorded on {baseline.get('data')}, results on {data}")
+    regressions = []
+    for view, metrics in results.items():
+        reference = baseline["views"].get(view)
+        if not reference:
+            continue
+        for metric in METRICS:
+            old, new = reference.get(metric), metrics.get(metric)
+            if old and new is not None and new > old * (1 + tolerance):
+                regressions.append((view, metric, old, new))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=10, help="Timed reruns per view")
+    parser.add_argument("--only", help="Only run views whose name contains this text")
+    parser.add_argument("--baseline", default=BASELINE_PATH)
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    parser.add_argument("--output", help="Write the results as JSON to this file")
+    parser.add_argument("--data-dir", help="Build a bundle from this raw data instead of the synthetic data")
+    parser.add_argument("--bundle", action="store_true", help="Use the built bundle/ (or SDG_BUNDLE_DIR)")
+    parser.add_argument("--view", help=argparse.SUPPRESS)  # Child process: run this one view, print JSON
+    args = parser.parse_args(argv)
+
+    data_dir = args.data_dir and os.path.abspath(args.data_dir)
+    os.chdir(REPO_ROOT)  # test.py reads Data/ and assets/ relative to the working directory
+    if args.view:
+        # Only the view's own indicator, so the child does not load goal7 just to list them
+        indicator = args.view.split("/", 1)[1] if args.view.startswith("indicator/") else None
+        print(json.dumps(bench_view(*views([indicator] if indicator else [])[args.view], args.runs)))
+        return 0
+
+    if args.bundle:
+        from sdg_dashboard import bundle
+
+        version = bundle.current_version()
+        if version is None:
+            parser.error(f"No bundle built in {bundle.BUNDLE_DIR}")
+        data = {"bundle": version}
+    else:
+        # The app only reads compiled bundles; build one in a temp directory (before
+        # sdg_dashboard.bundle is imported, which reads SDG_BUNDLE_DIR)
+        bundle_dir = tempfile.mkdtemp(prefix="sdg-bundle-")
+        os.environ["SDG_BUNDLE_DIR"] = bundle_dir
+        from sdg_dashboard import build, synth
+
+        if data_dir:
+            data = {"bundle": build.build(data_dir, bundle_dir)["version"]}
+        else:
+            print(f"Generating synthetic data {SYNTH_DATA}")
+            synth.generate(tempfile.mkdtemp(prefix="sdg-data-"), SYNTH_DATA["geo_areas"], SYNTH_DATA["years"],
+                           SYNTH_DATA["indicators"], SYNTH_DATA["missing_rate"], SYNTH_DATA["seed"], bundle_dir)
+            data = {"synth": SYNTH_DATA}
+
+    results, failed = {}, []
+    for name in views():
+        if args.only and args.only not in name:
+            continue
+        try:
+            metrics = bench_view_isolated(name, args.runs)
+        except Exception as exc:  # Report the view as broken and keep going
+            print(f"{name:<32} failed: {exc}")
+            failed.append(name)
+            continue
+        print(
+            f"{name:<32} p50 {metrics['p50_ms']:>9.2f} ms  p95 {metrics['p95_ms']:>9.2f} ms  "
+            f"payload {metrics['payload_bytes']:>9} B  peak RSS {metrics['peak_rss_mb']:>7.1f} MB"
+        )
+        if metrics["exceptions"] or metrics["errors"]:
+            # An error page is not the view; keep its timings out of the results
+            print(f"{'':<32} failed: {(metrics['exceptions'] + metrics['errors'])[0]}")
+            failed.append(name)
+            continue
+        results[name] = metrics
+
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump({"data": data, "views": results, "failed": failed}, file, indent=4)
+
+    if failed:
+        print(f"{len(failed)} view(s) failed: {', '.join(failed)}")
+
+    if args.save_baseline:
+        if failed:
+            print("Baseline not written")
+            return 1
+        with open(args.baseline, "w") as file:
+            json.dump({"data": data, "views": results}, file, indent=4)
+        print(f"Baseline written to {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(f"No baseline at {args.baseline}; run with --save-baseline to create one.")
+        return 1 if failed else 0
+
+    with open(args.baseline, "r") as file:
+        baseline = json.load(file)
+    try:
+        regressions = compare(results, baseline, args.tolerance, data)
+    except ValueError as exc:
+        print(f"Not compared: {exc}")
+        return 1 if failed else 0
+    for view, metric, old, new in regressions:
+        print(f"REGRESSION {view}: {metric} {old} -> {new}")
+    return 1 if regressions or failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
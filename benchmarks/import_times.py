@@ -0,0 +1,123 @@
+"""
+Import-time breakdown of the first rerun of each page.
+
+Runs every page once in a fresh interpreter under ``python -X importtime``
+(through Streamlit's AppTest, like bench_pages.py) and reports the modules
+that the first rerun imported: the total import time and the top-level
+packages that cost the most. This is the import cost a new process pays
+before it can serve its first visitor of that page.
+
+    python benchmarks/import_times.py                      # all pages
+    python benchmarks/import_times.py --page survey --top 20
+    python benchmarks/import_times.py --runs 5             # median of 5 interpreters
+
+The background warm-up and the data watcher are disabled, as their imports
+happen off the request path.
+"""
+
+import argparse
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+from collections import Counter
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SCRIPT_PATH = os.path.join(REPO_ROOT, "test.py")
+
+# Session state that opens each page (see sdg_dashboard/router.py)
+PAGES = {
+    "survey": {},
+    "sdg_map": {"page": "sdg_map"},
+    "dashboards": {"page": "dashboards"},
+    "results": {"page": "results"},
+}
+
+START_MARK = "--- first rerun ---"
+END_MARK = "--- done ---"
+
+# Runs in the child interpreter; everything before START_MARK is test harness
+CHILD = """
+import json, sys, time
+from streamlit.testing.v1 import AppTest
+at = AppTest.from_file({script!r}, default_timeout=120)
+for key, value in json.loads({state!r}).items():
+    at.session_state[key] = value
+print({start!r}, file=sys.stderr, flush=True)
+started = time.perf_counter()
+at.run()
+print({end!r}, file=sys.stderr, flush=True)
+print(json.dumps({{"rerun_ms": (time.perf_counter() - started) * 1000,
+                   "exceptions": [e.message for e in at.exception]}}))
+"""
+
+_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \| (\s*)(\S+)")
+
+
+def parse_importtime(stderr):
+    """{module: (self µs, cumulative µs, depth)} of the imports between the marks."""
+    modules = {}
+    inside = False
+    for line in stderr.splitlines():
+        if line.startswith(START_MARK):
+            inside = True
+        elif line.startswith(END_MARK):
+            break
+        elif inside:
+            match = _LINE.match(line)
+            if match:
+                self_us, cumulative_us, indent, name = match.groups()
+                modules[name] = (int(self_us), int(cumulative_us), len(indent) // 2)
+    return modules
+
+
+def measure(page):
+    """One fresh interpreter: (modules, result of the child)."""
+    env = dict(os.environ, SDG_WARMUP="0", SDG_WATCH="0")
+    code = CHILD.format(script=SCRIPT_PATH, state=json.dumps(PAGES[page]), start=START_MARK, end=END_MARK)
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=REPO_ROOT, env=env, capture_output=True, text=True, check=True,
+    )
+    return parse_importtime(completed.stderr), json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def breakdown(modules):
+    """Self time summed per top-level package, in ms."""
+    packages = Counter()
+    for name, (self_us, _, _) in modules.items():
+        packages[name.split(".")[0]] += self_us / 1000
+    return packages
+
+
+def report(page, runs, top):
+    totals, reruns, packages = [], [], Counter()
+    for _ in range(runs):
+        modules, result = measure(page)
+        if result["exceptions"]:
+            print(f"{page}: {result['exceptions']}", file=sys.stderr)
+        totals.append(sum(self_us for self_us, _, _ in modules.values()) / 1000)
+        reruns.append(result["rerun_ms"])
+        packages.update(breakdown(modules))
+    print(
+        f"\n{page}: first rerun {statistics.median(reruns):.0f} ms, "
+        f"of which imports {statistics.median(totals):.0f} ms ({len(modules)} modules)"
+    )
+    for name, ms in packages.most_common(top):
+        print(f"  {name:<28} {ms / runs:8.1f} ms")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Import-time breakdown of the first rerun per page.")
+    parser.add_argument("--page", choices=sorted(PAGES), action="append", help="Page to measure (repeatable; default all)")
+    parser.add_argument("--runs", type=int, default=3, help="Fresh interpreters per page (median is reported)")
+    parser.add_argument("--top", type=int, default=12, help="Packages to list per page")
+    args = parser.parse_args(argv)
+    for page in args.page or PAGES:
+        report(page, args.runs, args.top)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1 @@
+"""Shared helpers for the SDG dashboard (test.py)."""
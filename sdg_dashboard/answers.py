@@ -0,0 +1,29 @@
+"""
+Survey answers, stored as a JSON list in ``lib.py`` in the working directory.
+"""
+
+import json
+import os
+
+# Speicherort der Antworten
+DATA_FILE = "lib.py"
+
+
+# Funktion zum Laden der Antworten
+def load_answers():
+    if os.path.exists(DATA_FILE):
+        with open(DATA_FILE, "r") as file:
+            try:
+                return json.load(file)
+            except json.JSONDecodeError:
+                return []  # Leere Liste, falls die Datei leer oder ungültig ist
+    else:
+        return []  # Leere Liste, wenn die Datei nicht existiert
+
+
+# Funktion zum Speichern der Antworten
+def save_answer(reliability, knowledge):
+    answers = load_answers()
+    answers.append({"reliability_score": reliability, "sdg_knowledge_score": knowledge})
+    with open(DATA_FILE, "w") as file:
+        json.dump(answers, file, indent=4)
@@ -0,0 +1,154 @@
+"""
+Data availability per SDG, computed from the loaded datasets.
+
+The availability of a goal is the share of the UN member states with a
+value, averaged over the goal's indicators. It is computed from the null
+mask of the raw indicator columns (``sdg<goal>_<indicator>``) of the SDR
+2024 Full Database, reduced to all 17 goals in one matrix product. Member
+states are the rows with an ISO3 code.
+
+Breakdowns:
+
+- by region ("Regions used for the SDR" of the Full Database), as the share
+  of each region's member states,
+- by year, from the null masks of the goal scores in
+  ``sdg_index_2000-2022.csv``.
+
+The tables are cached per dataset version (see cache.py), so the chart
+follows the data bundle instead of a hand-maintained CSV.
+"""
+
+import re
+from functools import partial
+
+import numpy as np
+import pandas as pd
+
+from sdg_dashboard import bundle
+from sdg_dashboard.cache import budgeted_cache
+from sdg_dashboard.data import load_sdg_index, load_sdr_full_database
+
+UN_MEMBER_STATES = 193
+GOAL_NAMES = (
+    "Poverty", "Hunger", "Health", "Education", "Gender", "Water & Sanitation", "Energy", "Work",
+    "Industry", "Inequality", "Cities", "Consumption", "Climate", "Life/Water", "Life/Land", "Peace",
+    "Partnerships",
+)
+GOAL_LABELS = [f"{goal}: {name}" for goal, name in enumerate(GOAL_NAMES, start=1)]
+
+VALUE = "Data Availability (%)"
+REGION_COLUMN = "Regions used for the SDR"
+CODE_COLUMNS = ("id", "Country Code ISO3")  # ISO3 code of the Full Database, by SDR edition
+ISO3 = r"[A-Z]{3}"  # Regional aggregates have other ids
+INDICATOR_COLUMN = re.compile(r"sdg(\d{1,2})_\S+")  # Raw values, not "Year: ..." or "Normalized Score: ..."
+SCORE_COLUMN = re.compile(r"goal_(\d{1,2})_score")
+
+
+def _goal_columns(columns, pattern):
+    """{column: goal} of the columns matching pattern."""
+    goals = {}
+    for column in columns:
+        match = pattern.fullmatch(str(column))
+        if match and 1 <= int(match.group(1)) <= len(GOAL_NAMES):
+            goals[column] = int(match.group(1))
+    return goals
+
+
+def _is_member(codes):
+    return codes.astype("string").str.fullmatch(ISO3).fillna(False).to_numpy(dtype=bool)
+
+
+def member_states(full):
+    """The rows of the Full Database that are countries."""
+    code = next((column for column in CODE_COLUMNS if column in full.columns), None)
+    if code is None:
+        return full[full["Country"].notna()]
+    return full[_is_member(full[code])]
+
+
+def _state_count(count):
+    # Synthetic data (see synth.py) can have more countries than the UN
+    return max(UN_MEMBER_STATES, count)
+
+
+def _per_goal(counts, sizes, goals):
+    """
+    Availability per goal from the values per group and indicator (counts,
+    groups x indicators) and the member states per group (sizes). Returns
+    (groups x 17 percentages, NaN for goals without indicators; indicators per goal).
+    """
+    one_hot = (np.fromiter(goals.values(), dtype=np.int64)[:, None] == np.arange(1, len(GOAL_NAMES) + 1)).astype(np.float64)
+    series = one_hot.sum(axis=0)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return (counts / sizes[:, None]) @ one_hot / series * 100, series.astype(int)
+
+
+def _long(percent, index, name):
+    """Groups x goals -> Goal, <name>, Data Availability (%), goals in SDG order."""
+    table = pd.DataFrame(percent, index=pd.Index(index, name=name), columns=GOAL_LABELS)
+    table = table.melt(ignore_index=False, var_name="Goal", value_name=VALUE).reset_index()
+    table["Goal"] = pd.Categorical(table["Goal"], categories=GOAL_LABELS)
+    return table.dropna(subset=[VALUE])[["Goal", name, VALUE]].reset_index(drop=True)
+
+
+@budgeted_cache(version=partial(bundle.dataset_hash, "sdr2024"))
+def goal_coverage():
+    """Goal, Series (indicators), Data Availability (%) per SDG, highest first; None without the Full Database."""
+    full = load_sdr_full_database()
+    if full is None:
+        return None
+    members = member_states(full)
+    goals = _goal_columns(members.columns, INDICATOR_COLUMN)
+    counts = members[list(goals)].notna().to_numpy().sum(axis=0, keepdims=True)
+    percent, series = _per_goal(counts, np.array([_state_count(len(members))]), goals)
+    table = pd.DataFrame({"Goal": GOAL_LABELS, "Series": series, VALUE: percent[0]})
+    table = table[table["Series"] > 0].sort_values(VALUE, ascending=False, kind="stable")
+    return table.reset_index(drop=True)
+
+
+@budgeted_cache(version=partial(bundle.dataset_hash, "sdr2024"))
+def coverage_by_region():
+    """Goal, Region, Data Availability (%); None without the Full Database or its region column."""
+    full = load_sdr_full_database()
+    if full is None or REGION_COLUMN not in full.columns:
+        return None
+    members = member_states(full)
+    goals = _goal_columns(members.columns, INDICATOR_COLUMN)
+    grouped = members[list(goals)].notna().groupby(members[REGION_COLUMN], observed=True, sort=False)
+    counts = grouped.sum()
+    percent, _ = _per_goal(counts.to_numpy(), grouped.size().to_numpy(), goals)
+    return _long(percent, counts.index.astype(str), "Region")
+
+
+@budgeted_cache(version=partial(bundle.dataset_hash, "sdg_index"))
+def coverage_by_year():
+    """Goal, Year, Data Availability (%) from the goal scores of the SDG index; None without it."""
+    index = load_sdg_index()
+    if index is None:
+        return None
+    index = index[_is_member(index["country_code"])]
+    goals = _goal_columns(index.columns, SCORE_COLUMN)
+    grouped = index[list(goals)].notna().groupby(index["year"], sort=True)
+    counts = grouped.sum()
+    # Every member state counts, also those without a row in a year
+    states = np.full(len(counts), _state_count(index["country_code"].nunique()))
+    percent, _ = _per_goal(counts.to_numpy(), states, goals)
+    return _long(percent, counts.index, "Year")
+
+
+# Breakdown -> table (None: one value per goal)
+BREAKDOWNS = {
+    None: goal_coverage,
+    "Year": coverage_by_year,
+    "Region": coverage_by_region,
+}
+
+
+def dataset(breakdown):
+    """The dataset a breakdown is computed from."""
+    return "sdg_index" if breakdown == "Year" else "sdr2024"
+
+
+def has_data(breakdown):
+    """True if the bundle has the table a breakdown is computed from."""
+    return bundle.has("sdg_index" if breakdown == "Year" else "sdr2024_full")
@@ -0,0 +1,373 @@
+"""
+Offline compilation of ``Data/`` into the dataset bundle.
+
+    python -m sdg_dashboard.build [--data-dir Data] [--out bundle]
+
+All raw XLSX/CSV files are parsed, validated and normalized in one pass at
+deploy time, so the app never parses them at runtime:
+
+- column names and text values are stripped,
+- every table gets its declared schema (``SCHEMAS``): categorical keys,
+  int16 years and float32 values,
+- rows without the values the charts need are dropped,
+- wide year/percentile tables are melted into a tidy long layout.
+
+Each dataset is written as one or more Arrow IPC tables into a new version
+directory ``<out>/<version>/`` together with ``manifest.json`` (sha256 of
+every source file, table and dataset, row counts, columns). The version is
+derived from the table hashes, so an unchanged ``Data/`` gives the same
+version. ``<out>/CURRENT`` names the version the app loads; it is switched
+atomically once the whole version is written.
+
+The figures of the fixed-content views (figures.STATIC_FIGURES) are built
+here as well and stored as Plotly JSON next to their dataset, so the app
+never rebuilds them.
+
+Builds are incremental: a dataset whose source files have the same sha256
+as in the current version is linked from there instead of being parsed
+again (``--full`` rebuilds everything). Concurrent builds into the same
+directory are serialized with a lock file. After a successful build, the
+versions other than the current one are deleted; processes that still have
+their tables memory-mapped keep reading them until they switch.
+
+Missing source files are reported and skipped; missing columns or empty
+datasets fail the build.
+"""
+
+import argparse
+import fcntl
+import hashlib
+import json
+import os
+import shutil
+import sys
+from collections import defaultdict
+from datetime import datetime, timezone
+
+import pandas as pd
+
+from sdg_dashboard import bundle, figures
+
+DATA_DIR = os.environ.get("SDG_DATA_DIR", "Data")
+
+# Declared dtypes per table. Categories keep the order of appearance in the
+# file, so charts keep their order; undeclared float columns become FLOAT_DTYPE.
+SCHEMAS = {
+    "sdr2024_full": {"Country": "category", "Regions used for the SDR": "category"},
+    "sdr2024_overview": {"Country": "category"},
+    "goal7": {
+        "Goal": "category",
+        "Target": "category",
+        "Indicator": "category",
+        "SeriesCode": "category",
+        "GeoAreaName": "category",
+        "TimePeriod": "int16",
+        "Value": "float32",
+        "UpperBou": "float32",
+        "LowerBou": "float32",
+        "Location": "category",
+        "Type of renewable technology": "category",
+    },
+    "elecloss2": {
+        "Country Name": "category",
+        "Country Code": "category",
+        "Year": "int16",
+        "Electricity Loss (%)": "float32",
+    },
+    "sdg_index": {"country_code": "category", "country": "category", "year": "int16"},
+    "comparison_linear": {"Country": "category", "IncomeGroup": "category", "Value": "float32"},
+    "comparison_log": {"Country": "category", "IncomeGroup": "category", "Value": "float32"},
+}
+FLOAT_DTYPE = "float32"
+
+
+class BuildError(Exception):
+    """A source file does not have the expected layout."""
+
+
+def _require(frame, columns, source):
+    missing = [column for column in columns if column not in frame.columns]
+    if missing:
+        raise BuildError(f"{source}: missing column(s) {', '.join(missing)}")
+    if frame.empty:
+        raise BuildError(f"{source}: no rows")
+
+
+def _strip(frame):
+    """Strips column names and all text values."""
+    frame = frame.rename(columns=lambda name: name.strip() if isinstance(name, str) else name)
+    for column in frame.columns:
+        if frame[column].dtype == object or pd.api.types.is_string_dtype(frame[column].dtype):
+            frame[column] = frame[column].map(lambda value: value.strip() if isinstance(value, str) else value)
+    return frame
+
+
+def apply_schema(frame, table):
+    """Casts the columns of a table to its declared dtypes."""
+    schema = SCHEMAS.get(table, {})
+    for column in frame.columns:
+        dtype = schema.get(column)
+        if dtype == "category":
+            values = frame[column]
+            frame[column] = pd.Categorical(values, categories=values.dropna().unique())
+        elif dtype is not None:
+            frame[column] = frame[column].astype(dtype)
+        elif pd.api.types.is_float_dtype(frame[column].dtype):
+            frame[column] = frame[column].astype(FLOAT_DTYPE)
+    return frame
+
+
+def _melt_years(frame, id_vars, value_name):
+    """Wide table with one column per year -> long table with an int Year column."""
+    year_columns = [column for column in frame.columns if str(column).strip().isdigit()]
+    long = frame.melt(id_vars=id_vars, value_vars=year_columns, var_name="Year", value_name=value_name)
+    long["Year"] = long["Year"].astype(int)
+    long[value_name] = pd.to_numeric(long[value_name], errors="coerce")
+    return long
+
+
+# --- Datasets: source files -> normalized tables ---
+
+def build_sdr2024(data_dir):
+    source = os.path.join(data_dir, "SDR2024-data.xlsx")
+    full = _strip(pd.read_excel(source, sheet_name="Full Database", engine="openpyxl"))
+    overview = _strip(pd.read_excel(source, sheet_name="Overview", engine="openpyxl"))
+    _require(full, ["Country"], f"{source} [Full Database]")
+    _require(overview, ["Country"], f"{source} [Overview]")
+    overview = overview.dropna(subset=["Country"])
+    return {"sdr2024_full": full, "sdr2024_overview": overview}
+
+
+def build_goal7(data_dir):
+    source = os.path.join(data_dir, "Goal7.xlsx")
+    data = _strip(pd.read_excel(source, engine="openpyxl"))
+    _require(data, ["Indicator", "GeoAreaName", "Value", "TimePeriod"], source)
+    data["Value"] = pd.to_numeric(data["Value"], errors="coerce")
+    data["TimePeriod"] = pd.to_numeric(data["TimePeriod"], errors="coerce")
+    data = data.dropna(subset=["Indicator", "GeoAreaName", "Value", "TimePeriod"])
+    data["TimePeriod"] = data["TimePeriod"].astype(int)
+    return {"goal7": data.reset_index(drop=True)}
+
+
+ID_COLUMNS_ELECLOSS = ("Country Name", "Country Code", "Indicator Name", "Indicator Code")
+
+
+def build_elecloss2(data_dir):
+    source = os.path.join(data_dir, "elecloss2.csv")
+    # Year columns are parsed as float32 directly
+    dtypes = defaultdict(lambda: FLOAT_DTYPE, {name: "str" for name in ID_COLUMNS_ELECLOSS})
+    data = _strip(pd.read_csv(source, skiprows=4, dtype=dtypes))
+    _require(data, ["Country Name", "Country Code"], source)
+    data = data.dropna(subset=["Country Name"])
+    # Long layout: Country Name, Country Code, Year, Electricity Loss (%)
+    long = _melt_years(data, ["Country Name", "Country Code"], "Electricity Loss (%)")
+    if long.empty:
+        raise BuildError(f"{source}: no year columns")
+    return {"elecloss2": long}
+
+
+def build_sdg_index(data_dir):
+    source = os.path.join(data_dir, "sdg_index_2000-2022.csv")
+    # Missing scores stay NaN: their null mask is the data availability per year (see availability.py)
+    data = _strip(pd.read_csv(source, encoding="utf-8-sig", dtype={"country_code": "str", "country": "str"}))
+    _require(data, ["country_code", "year"], source)
+    data["year"] = pd.to_numeric(data["year"], errors="coerce")
+    data = data.dropna(subset=["country_code", "year"])
+    data["year"] = data["year"].astype(int)
+    return {"sdg_index": data.reset_index(drop=True)}
+
+
+def build_comparison_csvs(data_dir):
+    tables = {}
+    for name, filename in (("comparison_linear", "Linear.csv"), ("comparison_log", "Log.csv")):
+        source = os.path.join(data_dir, filename)
+        data = _strip(pd.read_csv(source, sep=";", dtype=defaultdict(lambda: FLOAT_DTYPE, Percentile="str")))
+        _require(data, ["Percentile"], source)
+        # Long layout: Country, IncomeGroup, Value
+        tables[name] = data.melt(
+            id_vars="Percentile", var_name="IncomeGroup", value_name="Value"
+        ).rename(columns={"Percentile": "Country"})
+    return tables
+
+
+def build_brazil_germany(data_dir):
+    source = os.path.join(data_dir, "Brazil Germany Comparison .xlsx")
+    data = _strip(pd.read_excel(source, engine="openpyxl"))
+    # The bar chart reads columns 3 and 4 of the first ten rows by position
+    if data.shape[1] < 5 or len(data) < 10:
+        raise BuildError(f"{source}: expected at least 10 rows and 5 columns, got {data.shape}")
+    return {"brazil_germany": data}
+
+
+# Dataset -> (builder, source files relative to the data directory)
+DATASETS = {
+    "sdr2024": (build_sdr2024, ["SDR2024-data.xlsx"]),
+    "goal7": (build_goal7, ["Goal7.xlsx"]),
+    "elecloss2": (build_elecloss2, ["elecloss2.csv"]),
+    "sdg_index": (build_sdg_index, ["sdg_index_2000-2022.csv"]),
+    "comparison_csvs": (build_comparison_csvs, ["Linear.csv", "Log.csv"]),
+    "brazil_germany": (build_brazil_germany, ["Brazil Germany Comparison .xlsx"]),
+}
+
+
+def sha256_file(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as file:
+        for chunk in iter(lambda: file.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _write_current(out_dir, version):
+    path = os.path.join(out_dir, "CURRENT")
+    tmp_path = f"{path}.tmp-{os.getpid()}"
+    with open(tmp_path, "w") as file:
+        file.write(version + "\n")
+    os.replace(tmp_path, path)
+
+
+def _prune(out_dir, keep):
+    """Deletes the version directories of out_dir except keep; returns their names."""
+    pruned = []
+    for name in os.listdir(out_dir):
+        path = os.path.join(out_dir, name)
+        if name != keep and not name.startswith(".") and os.path.isfile(os.path.join(path, bundle.MANIFEST)):
+            shutil.rmtree(path, ignore_errors=True)
+            pruned.append(name)
+    return pruned
+
+
+def _reuse(current_dir, entry, stage_dir):
+    """Links the tables of an unchanged dataset from the current version."""
+    for info in entry["tables"].values():
+        source = os.path.join(current_dir, info["file"])
+        target = os.path.join(stage_dir, info["file"])
+        try:
+            os.link(source, target)
+        except OSError:  # e.g. a file system without hard links
+            shutil.copy2(source, target)
+
+
+def _build_dataset(builder, data_dir, stage_dir):
+    tables, frames = {}, {}
+    for table, frame in builder(data_dir).items():
+        frame = apply_schema(frame, table)
+        path = os.path.join(stage_dir, f"{table}.arrow")
+        bundle.write_table(frame, path)
+        tables[table] = {
+            "file": os.path.basename(path),
+            "sha256": sha256_file(path),
+            "rows": len(frame),
+            "columns": [str(column) for column in frame.columns],
+        }
+        frames[table] = frame
+    return tables, frames
+
+
+def _build_figures(dataset, frames, stage_dir):
+    """Prebuilds the static figures of a dataset as Plotly JSON (see figures.STATIC_FIGURES)."""
+    built = {}
+    for name, (source, make_figure) in figures.STATIC_FIGURES.items():
+        if source != dataset:
+            continue
+        path = os.path.join(stage_dir, f"{name}.figure.json")
+        with open(path, "w") as file:
+            file.write(figures.compact_figure(make_figure(frames)).to_json())
+        built[name] = {"file": os.path.basename(path), "sha256": sha256_file(path)}
+    return built
+
+
+def _dataset_hash(tables, built_figures):
+    hashes = [info["sha256"] for info in tables.values()] + [info["sha256"] for info in built_figures.values()]
+    return hashlib.sha256("".join(hashes).encode()).hexdigest()
+
+
+def build(data_dir=DATA_DIR, out_dir=bundle.BUNDLE_DIR, full=False, log=print, datasets=None):
+    """
+    Compiles data_dir into a new bundle version in out_dir and switches
+    CURRENT to it; returns the manifest. Datasets with unchanged sources are
+    reused from the current version unless full is set. datasets replaces
+    DATASETS, e.g. with builders of in-memory tables (see synth.py).
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    with open(os.path.join(out_dir, ".build.lock"), "w") as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)  # One build at a time per bundle directory
+        return _build_locked(data_dir, out_dir, full, log, DATASETS if datasets is None else datasets)
+
+
+def _build_locked(data_dir, out_dir, full, log, builders):
+    current = {} if full else bundle.manifest(out_dir)
+    current_dir = os.path.join(out_dir, current["version"]) if current else None
+    stage_dir = os.path.join(out_dir, f".build-{os.getpid()}")
+    shutil.rmtree(stage_dir, ignore_errors=True)
+    os.makedirs(stage_dir)
+
+    datasets = {}
+    try:
+        for dataset, (builder, sources) in builders.items():
+            missing = [name for name in sources if not os.path.exists(os.path.join(data_dir, name))]
+            if missing:
+                log(f"Skipping {dataset}: {', '.join(missing)} not found in {data_dir}")
+                continue
+            source_hashes = {name: sha256_file(os.path.join(data_dir, name)) for name in sources}
+            previous = current.get("datasets", {}).get(dataset)
+            if previous is not None and previous["sources"] == source_hashes and "sha256" in previous:
+                _reuse(current_dir, previous, stage_dir)
+                tables = previous["tables"]
+                frames = {table: bundle.read_table(os.path.join(stage_dir, info["file"])) for table, info in tables.items()}
+                log(f"Unchanged {dataset}")
+            else:
+                tables, frames = _build_dataset(builder, data_dir, stage_dir)
+                log(f"Built {dataset}: " + ", ".join(f"{t} ({info['rows']:,} rows)" for t, info in tables.items()))
+            # Figures are always rebuilt, so changes to their code are picked up too
+            built_figures = _build_figures(dataset, frames, stage_dir)
+            datasets[dataset] = {
+                "sources": source_hashes,
+                "sha256": _dataset_hash(tables, built_figures),
+                "tables": tables,
+                "figures": built_figures,
+            }
+
+        version = hashlib.sha256("".join(sorted(entry["sha256"] for entry in datasets.values())).encode()).hexdigest()[:12]
+        manifest = {
+            "version": version,
+            "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "data_dir": os.path.abspath(data_dir),
+            "datasets": datasets,
+        }
+        with open(os.path.join(stage_dir, bundle.MANIFEST), "w") as file:
+            json.dump(manifest, file, indent=2)
+
+        version_dir = os.path.join(out_dir, version)
+        if os.path.isdir(version_dir):
+            shutil.rmtree(stage_dir)  # Same content is already built
+        else:
+            os.rename(stage_dir, version_dir)
+    except BaseException:
+        shutil.rmtree(stage_dir, ignore_errors=True)
+        raise
+
+    if manifest["version"] != current.get("version"):
+        _write_current(out_dir, version)
+    pruned = _prune(out_dir, version)
+    if pruned:
+        log(f"Pruned old version(s) {', '.join(sorted(pruned))}")
+    return manifest
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Validate and compile Data/ into a versioned dataset bundle.")
+    parser.add_argument("--data-dir", default=DATA_DIR, help="Directory with the raw XLSX/CSV files")
+    parser.add_argument("--out", default=bundle.BUNDLE_DIR, help="Bundle directory")
+    parser.add_argument("--full", action="store_true", help="Rebuild all datasets, even unchanged ones")
+    args = parser.parse_args(argv)
+    try:
+        manifest = build(args.data_dir, args.out, full=args.full)
+    except BuildError as exc:
+        print(f"Build failed: {exc}", file=sys.stderr)
+        sys.exit(1)
+    print(f"Bundle version {manifest['version']} written to {os.path.join(args.out, manifest['version'])}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+"""
+Memory-mapped Arrow IPC bundle of the datasets.
+
+The datasets are compiled at deploy time (see build.py) into uncompressed
+Arrow IPC files on local disk:
+
+    bundle/CURRENT                  name of the version to load
+    bundle/<version>/manifest.json  content hashes, rows and columns per table
+    bundle/<version>/<table>.arrow
+    bundle/<version>/<figure>.figure.json  prebuilt figures of the fixed views
+
+The loaders memory-map these files read-only. The frames handed out are
+zero-copy views onto the mapped pages (numeric columns as NumPy arrays,
+strings as Arrow-backed string arrays), so all Streamlit processes on a host share the same page
+cache pages and per-host memory stays flat as workers are added.
+
+Floats are written with NaN as a value instead of an Arrow null, so they
+have no validity bitmap and map straight to float32/float64 NumPy arrays.
+Categorical columns are stored as Arrow dictionaries and come back as
+pandas Categoricals.
+The bundle directory is ``SDG_BUNDLE_DIR`` (default ``bundle``).
+"""
+
+import json
+import os
+import threading
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+BUNDLE_DIR = os.environ.get("SDG_BUNDLE_DIR", "bundle")
+MANIFEST = "manifest.json"
+
+try:
+    STRING_DTYPE = pd.StringDtype("pyarrow", na_value=np.nan)  # pandas' default "str" dtype
+except TypeError:  # pandas < 2.3
+    STRING_DTYPE = pd.StringDtype("pyarrow")
+
+
+def current_version(bundle_dir=None):
+    """Version named in CURRENT, None if no bundle has been built."""
+    try:
+        with open(os.path.join(bundle_dir or BUNDLE_DIR, "CURRENT")) as file:
+            return file.read().strip() or None
+    except FileNotFoundError:
+        return None
+
+
+def _load_manifest(bundle_dir):
+    version = current_version(bundle_dir)
+    if version is None:
+        return {}
+    with open(os.path.join(bundle_dir, version, MANIFEST)) as file:
+        return json.load(file)
+
+
+# Manifest of BUNDLE_DIR, reloaded when CURRENT is replaced
+_manifest_lock = threading.Lock()
+_manifest_cache = (None, {})
+
+
+def _current_signature():
+    try:
+        stat = os.stat(os.path.join(BUNDLE_DIR, "CURRENT"))
+    except FileNotFoundError:
+        return None
+    return stat.st_ino, stat.st_mtime_ns, stat.st_size
+
+
+def manifest(bundle_dir=None):
+    """
+    Manifest of the current version ({} if there is none). For the app's
+    bundle it is cached and only read again after CURRENT changed (one
+    stat() per call), so a new build is picked up without a restart.
+    """
+    global _manifest_cache
+    if bundle_dir is not None and os.path.abspath(bundle_dir) != os.path.abspath(BUNDLE_DIR):
+        return _load_manifest(bundle_dir)
+    signature = _current_signature()
+    with _manifest_lock:
+        if signature != _manifest_cache[0]:
+            _manifest_cache = (signature, _load_manifest(BUNDLE_DIR))
+        return _manifest_cache[1]
+
+
+def _tables(current):
+    return {table: info for entry in current.get("datasets", {}).values() for table, info in entry["tables"].items()}
+
+
+def has(*names):
+    """True if the current version contains all the given tables."""
+    tables = _tables(manifest())
+    return all(name in tables for name in names)
+
+
+def has_figure(name):
+    """True if the current version contains the prebuilt figure."""
+    return any(name in entry.get("figures", {}) for entry in manifest().get("datasets", {}).values())
+
+
+def read_figure(name):
+    """Serialized Plotly JSON of a prebuilt figure of the current version."""
+    with open(os.path.join(BUNDLE_DIR, manifest()["version"], f"{name}.figure.json")) as file:
+        return file.read()
+
+
+def dataset_hash(dataset):
+    """Content hash of a dataset in the current version (None if it is not in the bundle)."""
+    entry = manifest().get("datasets", {}).get(dataset)
+    return entry.get("sha256") if entry else None
+
+
+def _column_to_arrow(column):
+    if pd.api.types.is_float_dtype(column.dtype):
+        dtype = "float32" if column.dtype.itemsize == 4 else "float64"
+        return pa.array(column.to_numpy(dtype=dtype, na_value=np.nan), from_pandas=False)
+    try:
+        return pa.array(column, from_pandas=True)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        # Mixed object columns from Excel: keep them as text
+        return pa.array(column.map(lambda value: None if pd.isna(value) else str(value)), type=pa.string())
+
+
+def to_arrow(frame):
+    """Converts a DataFrame to an Arrow table (the index is dropped)."""
+    return pa.table({str(name): _column_to_arrow(frame[name]) for name in frame.columns})
+
+
+def write_table(frame, path):
+    """Writes the frame as an uncompressed Arrow IPC file, replacing it atomically."""
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    table = to_arrow(frame)
+    tmp_path = f"{path}.tmp-{os.getpid()}"
+    with pa.OSFile(tmp_path, "wb") as sink:
+        with pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+    os.replace(tmp_path, path)
+
+
+def _types_mapper(arrow_type):
+    if pa.types.is_string(arrow_type) or pa.types.is_large_string(arrow_type):
+        return STRING_DTYPE
+    return None
+
+
+def read_table(path):
+    """Memory-maps an Arrow IPC file and returns a zero-copy DataFrame view of it."""
+    source = pa.memory_map(path, "r")
+    table = pa.ipc.open_file(source).read_all()
+    return table.to_pandas(split_blocks=True, types_mapper=_types_mapper)
+
+
+def read(*names):
+    """Reads one table of the current version as a DataFrame, several as a tuple."""
+    version = manifest()["version"]
+    frames = tuple(read_table(os.path.join(BUNDLE_DIR, version, f"{name}.arrow")) for name in names)
+    return frames[0] if len(frames) == 1 else frames
@@ -0,0 +1,228 @@
+"""
+Memory-budgeted cache for the parsed datasets.
+
+Replaces ``@st.cache_data`` on the dataset loaders. Every cached value is
+measured (deep memory size of DataFrames, including the Python string
+objects), and the total is kept below a global byte budget by evicting the
+least recently used entries. Size, hits and misses are recorded per entry so
+containers can be sized from real numbers.
+
+The budget is ``SDG_CACHE_BUDGET_MB`` (default 1024). A single value that is
+larger than the whole budget is still cached, it just evicts everything else.
+Unlike ``st.cache_data``, values are not copied per call: callers get
+zero-copy views that cannot modify the cached frames (see frames.py).
+Loaders can key their entries by the content hash of their data, so a new
+data version is loaded on the next call (see watcher.py).
+"""
+
+import contextlib
+import functools
+import logging
+import os
+import sys
+import threading
+import time
+from collections import OrderedDict
+
+_LOGGER = logging.getLogger(__name__)
+
+BUDGET_BYTES = int(float(os.environ.get("SDG_CACHE_BUDGET_MB", "1024")) * 1024 ** 2)
+
+
+def deep_size(obj):
+    """Approximate memory held by a cached value, in bytes."""
+    # pandas/NumPy are imported by the loaders; a value can only be a frame once they are
+    pd = sys.modules.get("pandas")
+    np = sys.modules.get("numpy")
+    if pd is not None and isinstance(obj, (pd.DataFrame, pd.Series)):
+        usage = obj.memory_usage(deep=True, index=True)
+        return int(usage.sum()) if isinstance(usage, pd.Series) else int(usage)
+    if np is not None and isinstance(obj, np.ndarray):
+        return int(obj.nbytes)
+    if isinstance(obj, (list, tuple, set, frozenset)):
+        return sys.getsizeof(obj) + sum(deep_size(item) for item in obj)
+    if isinstance(obj, dict):
+        return sys.getsizeof(obj) + sum(deep_size(k) + deep_size(v) for k, v in obj.items())
+    return sys.getsizeof(obj)
+
+
+def _is_missing(value):
+    """Loaders return None (or a tuple of Nones) for datasets that are not available."""
+    if isinstance(value, tuple):
+        return bool(value) and all(item is None for item in value)
+    return value is None
+
+
+class _Entry:
+    __slots__ = ("name", "value", "size", "hits", "created", "last_used")
+
+    def __init__(self, name, value, size):
+        self.name = name
+        self.value = value
+        self.size = size
+        self.hits = 0
+        self.created = self.last_used = time.time()
+
+
+class BudgetedCache:
+    """LRU cache whose entries together stay below budget bytes."""
+
+    def __init__(self, budget=BUDGET_BYTES):
+        self.budget = budget
+        self.total = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._misses = {}
+        self._lock = threading.RLock()
+        self._compute_locks = {}  # Key -> [lock, callers using it]; only keys being computed
+
+    @contextlib.contextmanager
+    def _computing(self, key):
+        """Holds the compute lock of key; the lock is dropped when its last caller leaves."""
+        with self._lock:
+            slot = self._compute_locks.setdefault(key, [threading.Lock(), 0])
+            slot[1] += 1
+        try:
+            with slot[0]:
+                yield
+        finally:
+            with self._lock:
+                slot[1] -= 1
+                if slot[1] == 0:
+                    del self._compute_locks[key]
+
+    def get_or_compute(self, key, name, compute):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                return self._hit(key, entry)
+
+        # One computation per key; concurrent callers wait for it
+        with self._computing(key):
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is not None:
+                    return self._hit(key, entry)
+            value = compute()
+            if _is_missing(value):
+                # Not cached, so the error shows again and a later bundle build is picked up
+                return value
+            size = deep_size(value)
+            with self._lock:
+                self._misses[key] = self._misses.get(key, 0) + 1
+                self._entries[key] = _Entry(name, value, size)
+                self.total += size
+                self._evict(keep=key)
+            return value
+
+    def get(self, key, default=None):
+        """The cached value of key (a hit), default if it is not cached; never computes."""
+        with self._lock:
+            entry = self._entries.get(key)
+            return default if entry is None else self._hit(key, entry)
+
+    def _hit(self, key, entry):
+        entry.hits += 1
+        entry.last_used = time.time()
+        self._entries.move_to_end(key)
+        return entry.value
+
+    def _evict(self, keep):
+        while self.total > self.budget and len(self._entries) > 1:
+            key, entry = next(iter(self._entries.items()))
+            if key == keep:
+                break
+            del self._entries[key]
+            self.total -= entry.size
+            self.evictions += 1
+            _LOGGER.info("Evicted %s (%d bytes) from the dataset cache", entry.name, entry.size)
+        if self.total > self.budget:
+            _LOGGER.warning(
+                "Dataset cache holds %d bytes, over its budget of %d bytes", self.total, self.budget
+            )
+
+    def stats(self):
+        """One dict per cached entry, most recently used last."""
+        with self._lock:
+            return [
+                {
+                    "name": entry.name,
+                    "version": key[1],
+                    "key": repr(key[2:]) if len(key) > 2 else "",
+                    "bytes": entry.size,
+                    "hits": entry.hits,
+                    "misses": self._misses.get(key, 0),
+                    "last_used": entry.last_used,
+                }
+                for key, entry in self._entries.items()
+            ]
+
+    def summary(self):
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self.total,
+                "budget": self.budget,
+                "evictions": self.evictions,
+            }
+
+    def invalidate(self, name, keep_version=None):
+        """Drops the entries of name, except those of keep_version; returns how many."""
+        with self._lock:
+            stale = [key for key, entry in self._entries.items()
+                     if entry.name == name and (keep_version is None or key[1] != keep_version)]
+            for key in stale:
+                self.total -= self._entries.pop(key).size
+                self._misses.pop(key, None)  # Stale versions are not asked for again
+            return len(stale)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._misses.clear()
+            self.total = 0
+
+
+# Shared by all loaders of the process
+dataset_cache = BudgetedCache()
+
+# Returned by the cached() lookup of a budgeted_cache function on a miss
+NOT_CACHED = object()
+
+
+def budgeted_cache(func=None, *, version=None):
+    """
+    Caches the function's return value in dataset_cache, keyed by its
+    arguments. version is an optional callable returning the content version
+    of the underlying data (e.g. its hash); it is part of the key, so new
+    content is a cache miss instead of a stale hit.
+
+    ``func.cached(*args, **kwargs)`` returns the cached value without
+    computing it, NOT_CACHED on a miss.
+    """
+    if func is None:
+        return functools.partial(budgeted_cache, version=version)
+
+    def key_of(args, kwargs):
+        return (
+            f"{func.__module__}.{func.__qualname__}",
+            version() if version is not None else None,
+            *args,
+            *sorted(kwargs.items()),
+        )
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        from sdg_dashboard.frames import share  # Imports pandas, first needed here
+
+        value = dataset_cache.get_or_compute(key_of(args, kwargs), func.__name__, lambda: func(*args, **kwargs))
+        return share(value)
+
+    def cached(*args, **kwargs):
+        from sdg_dashboard.frames import share
+
+        value = dataset_cache.get(key_of(args, kwargs), NOT_CACHED)
+        return value if value is NOT_CACHED else share(value)
+
+    wrapper.cached = cached
+    return wrapper
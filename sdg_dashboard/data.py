@@ -0,0 +1,110 @@
+"""
+Cached dataset loaders of the dashboard.
+
+The loaders live in an importable module (and not in test.py) so that the
+warm-up thread and every session share the same cached functions. Datasets
+are held in the memory-budgeted cache (see cache.py); the map index and the
+icons are small process-wide resources.
+
+The app never parses the raw files in ``Data/``: they are compiled at deploy
+time (``python -m sdg_dashboard.build``) and the loaders memory-map the
+resulting bundle (see bundle.py). Each loader is cached per content hash of
+its dataset, so a new build is served without a restart.
+"""
+
+from functools import partial
+
+import streamlit as st
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+from sdg_dashboard import bundle
+from sdg_dashboard.cache import budgeted_cache
+from sdg_dashboard.icons import load_sdg_icons
+from sdg_dashboard.map_index import CountryIndex
+from sdg_dashboard.metrics import track_misses
+
+BUILD_HINT = "Build it with 'python -m sdg_dashboard.build'."
+
+
+def report_missing(source):
+    """Shows that a dataset is missing; only on the script thread, where st.error reaches the page."""
+    if get_script_run_ctx() is not None:
+        st.error(f"Dataset '{source}' is not in the data bundle. {BUILD_HINT}")
+
+
+def _read_bundle(*tables, source):
+    """
+    Reads tables from the data bundle; returns None(s) if they are missing
+    and reports that on the script thread (registry workers report through
+    registry.get).
+    """
+    if bundle.has(*tables):
+        return bundle.read(*tables)
+    report_missing(source)
+    return None if len(tables) == 1 else (None,) * len(tables)
+
+
+# Funktion zum Laden der SDG-Daten (Status und Trend je Land und SDG, Blatt "Overview")
+@budgeted_cache(version=partial(bundle.dataset_hash, "sdr2024"))
+@track_misses
+def load_sdr_overview():
+    return _read_bundle("sdr2024_overview", source="SDR2024-data.xlsx")
+
+
+# Blatt "Full Database": nur laden, wo es gebraucht wird
+@budgeted_cache(version=partial(bundle.dataset_hash, "sdr2024"))
+@track_misses
+def load_sdr_full_database():
+    return _read_bundle("sdr2024_full", source="SDR2024-data.xlsx")
+
+
+@budgeted_cache(version=partial(bundle.dataset_hash, "goal7"))
+@track_misses
+def load_goal7_data():
+    # Indicator names are stripped and incomplete rows dropped at build time
+    return _read_bundle("goal7", source="Goal7.xlsx")
+
+
+@budgeted_cache(version=partial(bundle.dataset_hash, "elecloss2"))
+@track_misses
+def load_elecloss2_data():
+    # Long layout: Country Name, Country Code, Year, Electricity Loss (%)
+    return _read_bundle("elecloss2", source="elecloss2.csv")
+
+
+# SDG-Index und Zielwerte je Land und Jahr (für die Datenverfügbarkeit je Jahr)
+@budgeted_cache(version=partial(bundle.dataset_hash, "sdg_index"))
+@track_misses
+def load_sdg_index():
+    return _read_bundle("sdg_index", source="sdg_index_2000-2022.csv")
+
+
+@budgeted_cache(version=partial(bundle.dataset_hash, "comparison_csvs"))
+@track_misses
+def load_comparison_csvs():
+    """
+    Lädt die Einkommensvergleiche aus Linear.csv und Log.csv, bereits im
+    Long-Format (Country, IncomeGroup, Value).
+    """
+    return _read_bundle("comparison_linear", "comparison_log", source="Linear.csv / Log.csv")
+
+
+@budgeted_cache(version=partial(bundle.dataset_hash, "brazil_germany"))
+@track_misses
+def load_brazil_germany_comparison_data():
+    """
+    Lädt die Excel-Datei 'Brazil Germany Comparison .xlsx' aus dem Data-Bundle.
+    """
+    return _read_bundle("brazil_germany", source="Brazil Germany Comparison .xlsx")
+
+
+# Räumlicher Index der Länderpolygone für Klicks auf die Karte (einmal pro Prozess)
+@st.cache_resource
+def load_country_index():
+    return CountryIndex.from_shapefile()
+
+
+# SDG-Icons einmal pro Prozess verkleinern und im Speicher halten
+@st.cache_resource
+def load_icons():
+    return load_sdg_icons()
@@ -0,0 +1,103 @@
+"""
+Largest-triangle-three-buckets (LTTB) downsampling of line series.
+
+A line with more points than the chart has pixels only costs transfer and
+drawing time. LTTB keeps the first and last point and, from each of
+``threshold - 2`` equal buckets in between, the point that forms the
+largest triangle with the previously kept point and the average of the
+next bucket. Peaks and dips survive, unlike with plain striding.
+
+Gaps (NaN values) are kept: every run of finite points is downsampled on
+its own and the runs stay separated by a NaN. The threshold is shared by
+the runs, in proportion to their length, and every run keeps at least its
+endpoints. A series with more runs than threshold / 2 is downsampled as a
+whole instead; a gap then stays where two kept points lie in different runs.
+"""
+
+import numpy as np
+
+
+def lttb_indices(x, y, threshold):
+    """Indices of the points LTTB keeps of the finite series (x, y)."""
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    n = len(x)
+    if threshold >= n:
+        return np.arange(n)
+    if threshold < 3:  # No buckets in between: the endpoints
+        return np.array([0, n - 1], dtype=np.int64)
+
+    every = (n - 2) / (threshold - 2)
+    indices = np.empty(threshold, dtype=np.int64)
+    indices[0] = 0
+    a = 0
+    for i in range(threshold - 2):
+        start = int(i * every) + 1
+        end = int((i + 1) * every) + 1
+        next_start = end
+        next_end = min(int((i + 2) * every) + 1, n)
+        if next_start >= next_end:  # Last bucket: the next "bucket" is the last point
+            next_start, next_end = n - 1, n
+        avg_x = x[next_start:next_end].mean()
+        avg_y = y[next_start:next_end].mean()
+        area = np.abs(
+            (x[a] - avg_x) * (y[start:end] - y[a]) - (x[a] - x[start:end]) * (avg_y - y[a])
+        )
+        a = start + int(np.argmax(area))
+        indices[i + 1] = a
+    indices[-1] = n - 1
+    return indices
+
+
+def downsample_indices(x, y, threshold):
+    """
+    Indices to keep so that the series has about threshold points, split at
+    NaN gaps. Returns (indices, gap_after): gap_after marks kept points that
+    are followed by a gap, where a NaN point has to be inserted.
+    """
+    y = np.asarray(y, dtype=np.float64)
+    finite = np.isfinite(y)
+    if finite.all() or not finite.any():
+        indices = lttb_indices(x, y, threshold) if finite.all() else np.arange(len(y))
+        return indices, np.zeros(len(indices), dtype=bool)
+
+    # Runs of consecutive finite points
+    edges = np.flatnonzero(np.diff(np.concatenate(([0], finite.astype(np.int8), [0]))))
+    starts, ends = edges[::2], edges[1::2]
+    lengths = ends - starts
+    x = np.asarray(x, dtype=np.float64)
+    budgets = np.minimum(lengths, 2)  # The endpoints of every run
+    if budgets.sum() > threshold:
+        return _downsample_across_gaps(x, y, finite, threshold)
+
+    # The rest of the threshold in proportion to the points beyond the endpoints
+    rest = lengths - budgets
+    if rest.sum():
+        budgets += (threshold - budgets.sum()) * rest // rest.sum()
+    kept, gaps = [], []
+    for run_start, run_end, budget in zip(starts, ends, budgets):
+        run = run_start + lttb_indices(x[run_start:run_end], y[run_start:run_end], budget)
+        kept.append(run)
+        gap = np.zeros(len(run), dtype=bool)
+        gap[-1] = True
+        gaps.append(gap)
+    gaps[-1][-1] = False
+    return np.concatenate(kept), np.concatenate(gaps)
+
+
+def _downsample_across_gaps(x, y, finite, threshold):
+    """LTTB over all finite points; a gap follows each kept point whose successor is in another run."""
+    points = np.flatnonzero(finite)
+    indices = points[lttb_indices(x[points], y[points], threshold)]
+    run = np.cumsum(~finite)[indices]  # NaNs before the point: equal within a run
+    return indices, np.append(run[:-1] != run[1:], False)
+
+
+def expand_gaps(indices, gap_after):
+    """
+    Index array with the point before each gap repeated, and the positions of
+    those repeats (their y value is set to NaN to break the line).
+    """
+    after = np.flatnonzero(gap_after)
+    expanded = np.insert(indices, after + 1, indices[after])
+    return expanded, after + 1 + np.arange(len(after))
@@ -0,0 +1,291 @@
+"""
+Static export of the fixed parts of the dashboard.
+
+    python -m sdg_dashboard.export [OUT] [--survey-url URL]
+
+Pre-renders everything that does not depend on user input into a directory
+of plain files that any static file server can serve (e.g. a CDN, GitHub
+Pages or ``python -m http.server``), so traffic spikes need no Python per
+visitor:
+
+    index.html              the 17 SDG maps with the status/trend panel
+    comparison.html         Brazil/Germany income and energy expenditure charts
+    data-availability.html  data availability per SDG
+    maps/sdg<n>.json        map figures, fetched when an SDG is selected
+    plotly.min.js, icons/   shared by the pages
+
+The pages read the compiled data bundle (see build.py), like the app. The
+survey and the views with free selections (Indicator Dashboard, Electricity
+Loss) stay in the Streamlit app; ``--survey-url`` links to it.
+"""
+
+import argparse
+import html
+import json
+import os
+
+import plotly.graph_objects as go
+from plotly.offline import get_plotlyjs
+
+from sdg_dashboard import availability, data, figures
+from sdg_dashboard.icons import icon_width
+
+OUT_DIR = "site"
+
+PAGES = [
+    ("index.html", "SDG Map"),
+    ("comparison.html", "Brazil Germany Comparison"),
+    ("data-availability.html", "Data Availability"),
+]
+
+STYLE = """
+body { font-family: sans-serif; margin: 0 24px 24px; color: #262730; }
+nav { display: flex; gap: 20px; padding: 14px 0; border-bottom: 1px solid #ddd; margin-bottom: 16px; }
+nav a { color: #3498db; text-decoration: none; }
+nav a.active { font-weight: bold; color: #262730; }
+.columns { display: flex; gap: 24px; }
+.side { flex: 1.5; }
+.main { flex: 4; }
+.swatch { display: inline-block; width: 20px; height: 20px; margin-right: 10px; vertical-align: middle; }
+.strip { display: flex; gap: 6px; flex-wrap: wrap; border-top: 1px solid #ddd; padding-top: 12px; }
+.strip button { background: none; border: 2px solid transparent; padding: 2px; cursor: pointer; }
+.strip button.active { border-color: #3498db; }
+.row { display: flex; gap: 24px; }
+.row > div { flex: 1; }
+"""
+
+
+def _page(filename, title, body, survey_url=None):
+    links = "".join(
+        f'<a href="{href}"{" class=active" if href == filename else ""}>{html.escape(label)}</a>'
+        for href, label in PAGES
+    )
+    if survey_url:
+        links += f'<a href="{html.escape(survey_url)}">Take the survey</a>'
+    return f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>{html.escape(title)}</title>
+<style>{STYLE}</style>
+<script src="plotly.min.js"></script>
+</head>
+<body>
+<nav>{links}</nav>
+{body}
+</body>
+</html>
+"""
+
+
+def _figure_div(div_id, fig):
+    """A div and the script that draws the figure into it."""
+    return (
+        f'<div id="{div_id}"></div>\n'
+        f'<script>(function () {{ const spec = {fig.to_json()};\n'
+        f'Plotly.newPlot("{div_id}", spec.data, spec.layout, {{responsive: true}}); }})();</script>'
+    )
+
+
+def _json_script(value):
+    # Safe inside <script>: no "</" sequences
+    return json.dumps(value, ensure_ascii=False).replace("</", "<\\/")
+
+
+MAP_SCRIPT = """
+const STATUS = __STATUS__;
+const SDG_LABELS = __LABELS__;
+const STATUS_TEXT = __STATUS_TEXT__;
+const STATUS_HEX = __STATUS_HEX__;
+const TREND_TEXT = __TREND_TEXT__;
+let selectedSdg = 0;
+let clickBound = false;
+
+function showCountry() {
+  const country = document.getElementById("country").value;
+  const row = STATUS.rows[country] || [];
+  const [status, trend] = row[selectedSdg] || [null, null];
+  document.getElementById("trend-title").textContent = "Trend for " + SDG_LABELS[selectedSdg];
+  document.getElementById("status").innerHTML = status === null ? "" :
+    `<span class="swatch" style="background:${STATUS_HEX[status] || "#808080"}"></span>` +
+    `<span>${STATUS_TEXT[status] || "No description available."}</span>`;
+  document.getElementById("trend").innerHTML = trend === null ? "" :
+    `<span style="font-size:24px;margin-right:10px">${trend}</span>` +
+    `<span>${TREND_TEXT[String(trend).trim()] || "No trend description available."}</span>`;
+}
+
+function showSdg(index) {
+  selectedSdg = index;
+  document.querySelectorAll(".strip button").forEach((button, i) => button.classList.toggle("active", i === index));
+  fetch(`maps/sdg${index + 1}.json`).then(response => response.json()).then(spec => {
+    Plotly.react("map", spec.data, spec.layout, {responsive: true});
+    if (clickBound) return;
+    clickBound = true;
+    document.getElementById("map").on("plotly_click", event => {
+      const location = event.points[0] && event.points[0].location;
+      if (location in STATUS.rows) {
+        document.getElementById("country").value = location;
+        showCountry();
+      }
+    });
+  });
+  showCountry();
+}
+
+showSdg(0);
+"""
+
+
+def _status_table(color_data):
+    """{countries, rows: {country: [[status, trend] per SDG]}} from the Overview sheet."""
+    color_columns, trend_columns = figures.sdg_columns(color_data)
+    rows = {}
+    for _, record in color_data.iterrows():
+        rows[str(record["Country"])] = [
+            [
+                None if record[status] != record[status] else str(record[status]),  # NaN -> None
+                None if trend is None or record[trend] != record[trend] else str(record[trend]),
+            ]
+            for status, trend in zip(color_columns, trend_columns)
+        ]
+    return {"countries": list(rows), "rows": rows}
+
+
+def export_maps(out_dir, survey_url=None):
+    color_data = data.load_sdr_overview()
+    if color_data is None:
+        raise SystemExit("The SDR data is not in the bundle; run 'python -m sdg_dashboard.build' first.")
+
+    os.makedirs(os.path.join(out_dir, "maps"), exist_ok=True)
+    for i in range(figures.SDG_COUNT):
+        with open(os.path.join(out_dir, "maps", f"sdg{i + 1}.json"), "w") as file:
+            # The page loads the current plotly.js, which decodes typed arrays
+            file.write(figures.compact_figure(go.Figure(figures.generate_map(i))).to_json())
+
+    os.makedirs(os.path.join(out_dir, "icons"), exist_ok=True)
+    strip = []
+    for i, icon in enumerate(data.load_icons()):
+        label = html.escape(figures.SDG_LABELS[i])
+        if icon is not None:
+            with open(os.path.join(out_dir, "icons", f"sdg{i + 1}.png"), "wb") as file:
+                file.write(icon)
+            content = f'<img src="icons/sdg{i + 1}.png" width="{icon_width(i)}" alt="SDG {i + 1}: {label}">'
+        else:
+            content = f"SDG {i + 1}"
+        strip.append(f'<button title="{label}" onclick="showSdg({i})">{content}</button>')
+
+    status = _status_table(color_data)
+    legend = "".join(
+        f'<div><span class="swatch" style="background:{figures.COLOR_HEX_MAPPING[color]}"></span>{html.escape(text)}</div>'
+        for color, text in figures.STATUS_DESCRIPTIONS.items()
+    )
+    options = "".join(f"<option>{html.escape(country)}</option>" for country in status["countries"])
+    script = (
+        MAP_SCRIPT
+        .replace("__STATUS__", _json_script(status))
+        .replace("__LABELS__", _json_script(figures.SDG_LABELS))
+        .replace("__STATUS_TEXT__", _json_script(figures.STATUS_DESCRIPTIONS))
+        .replace("__STATUS_HEX__", _json_script(figures.COLOR_HEX_MAPPING))
+        .replace("__TREND_TEXT__", _json_script(figures.TREND_DESCRIPTIONS))
+    )
+    body = f"""
+<div class="columns">
+  <div class="side">
+    <h2>Instructions</h2>
+    <ol>
+      <li>Select an SDG by clicking its icon below the map.</li>
+      <li>View the map to see the global performance for the selected SDG.</li>
+      <li>Click a country on the map or use the dropdown under the legend to view its trend.</li>
+    </ol>
+    <h2>Tip</h2>
+    <p>Have a look at Brazil's performance at the SDG 7. Did you expect that?</p>
+    <h2>Bias</h2>
+    <details>
+      <summary>Read more about Bias...</summary>
+      <p>The data presented here is aggregated from various global sources and may include uncertainties.
+      Factors such as data quality, collection methods, and regional differences in reporting standards
+      could introduce biases. Interpret trends and performance cautiously, acknowledging these limitations.</p>
+      <p>The data we introduce may construct a narrative. As we cannot include all existing data in the current version,
+      we decided to provide the data that creates contrast and serves the investigation of our leading question.
+      This is undeterrable and induced by selective bias.</p>
+    </details>
+  </div>
+  <div class="main">
+    <h2 style="text-align: center">Global SDG Performance</h2>
+    <div id="map" style="height: 450px"></div>
+  </div>
+  <div class="side">
+    <h2>Legend</h2>
+    {legend}
+    <h3 id="trend-title" style="margin-top: 50px"></h3>
+    <label for="country">Select a country:</label>
+    <select id="country" onchange="showCountry()">{options}</select>
+    <div id="status" style="margin-top: 10px"></div>
+    <div id="trend"></div>
+  </div>
+</div>
+<div class="strip">{"".join(strip)}</div>
+<script>{script}</script>
+"""
+    with open(os.path.join(out_dir, "index.html"), "w") as file:
+        file.write(_page("index.html", "Global SDG Performance", body, survey_url))
+
+
+def export_comparison(out_dir, survey_url=None):
+    charts = {name: figures.static_figure(name) for name in ("income_linear", "income_log", "energy_expenditure")}
+    if any(fig is None for fig in charts.values()):
+        raise SystemExit("The comparison figures are not in the bundle; run 'python -m sdg_dashboard.build' first.")
+    body = f"""
+<div class="row">
+  <div>{_figure_div("income-linear", charts["income_linear"])}</div>
+  <div>{_figure_div("income-log", charts["income_log"])}</div>
+</div>
+<hr>
+<h1>Comparison of Per Capita Energy Expenditure Between Brazil and Germany</h1>
+{_figure_div("energy-expenditure", charts["energy_expenditure"])}
+<p>The graph shows income percentiles, which divide the population into equal 10% groups based on income levels.
+It compares the percentage of income spent on electricity in Brazil and Germany for each percentile group.</p>
+"""
+    with open(os.path.join(out_dir, "comparison.html"), "w") as file:
+        file.write(_page("comparison.html", "Brazil Germany Comparison", body, survey_url))
+
+
+def export_data_availability(out_dir, survey_url=None):
+    data_availability = availability.goal_coverage()
+    if data_availability is None:
+        raise SystemExit("The SDR 2024 Full Database is not in the bundle; run 'python -m sdg_dashboard.build' first.")
+    fig = figures.compact_figure(figures.data_availability_figure(data_availability))
+    median_availability = data_availability["Data Availability (%)"].median()
+    body = f"""
+<h1>Data Availability of UNO Member States</h1>
+{_figure_div("data-availability", fig)}
+<p><b>Data availability</b> indicates the percentage of {availability.UN_MEMBER_STATES} UNO Member States for which data exists for each
+Sustainable Development Goal, averaged over the indicators of the goal in the SDR 2024 database.<br><b>Median Data Availability:</b> {median_availability:.2f}%</p>
+"""
+    with open(os.path.join(out_dir, "data-availability.html"), "w") as file:
+        file.write(_page("data-availability.html", "Data Availability", body, survey_url))
+
+
+def export(out_dir=OUT_DIR, survey_url=None):
+    """Writes the static site into out_dir; returns the written page paths."""
+    os.makedirs(out_dir, exist_ok=True)
+    with open(os.path.join(out_dir, "plotly.min.js"), "w") as file:
+        file.write(get_plotlyjs())
+    export_maps(out_dir, survey_url)
+    export_comparison(out_dir, survey_url)
+    export_data_availability(out_dir, survey_url)
+    return [os.path.join(out_dir, filename) for filename, _ in PAGES]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Export the fixed views of the dashboard as a static site.")
+    parser.add_argument("out", nargs="?", default=OUT_DIR, help="Output directory")
+    parser.add_argument("--survey-url", help="URL of the Streamlit app with the survey, linked from every page")
+    args = parser.parse_args(argv)
+    for path in export(args.out, args.survey_url):
+        print(f"{path}: {os.path.getsize(path):,} bytes")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,420 @@
+"""
+Figures of the SDG dashboard that only depend on the loaded datasets.
+"""
+
+import os
+
+import numpy as np
+import plotly.graph_objects as go
+import plotly.io as pio
+import streamlit as st
+
+from sdg_dashboard import availability, bundle
+from sdg_dashboard.data import load_sdr_overview
+from sdg_dashboard.downsample import downsample_indices, expand_gaps
+from sdg_dashboard.metrics import reporting_enabled, span
+
+COLOR_HEX_MAPPING = {
+    "green": "#2ca02c",
+    "yellow": "#ffdd57",
+    "orange": "#ffa500",
+    "red": "#d62728",
+    "grey": "#808080"
+}
+
+SDG_COUNT = 17
+
+# Line charts switch to WebGL above this many line traces or points
+WEBGL_TRACES = int(os.environ.get("SDG_WEBGL_TRACES", "30"))
+WEBGL_POINTS = int(os.environ.get("SDG_WEBGL_POINTS", "5000"))
+# Points per line series, about the pixel width of a full-width chart
+MAX_POINTS = int(os.environ.get("SDG_MAX_POINTS", "1500"))
+
+SDG_LABELS = [
+    "No Poverty", "Zero Hunger", "Good Health and Well-being", "Quality Education",
+    "Gender Equality", "Clean Water and Sanitation", "Affordable and Clean Energy",
+    "Decent Work and Economic Growth", "Industry, Innovation and Infrastructure",
+    "Reduced Inequalities", "Sustainable Cities and Communities",
+    "Responsible Consumption and Production", "Climate Action", "Life Below Water",
+    "Life on Land", "Peace, Justice and Strong Institutions", "Partnerships for the Goals"
+]
+
+# Status colors of the Overview sheet
+STATUS_DESCRIPTIONS = {
+    "green": "Goal Achievement",
+    "yellow": "Challenges Remain",
+    "orange": "Significant Challenges",
+    "red": "Major Challenges",
+    "grey": "Insufficient Data"
+}
+
+TREND_DESCRIPTIONS = {
+    "↑": "On track or maintaining achievement",
+    "➚": "Moderately Increasing",
+    "→": "Stagnating",
+    "↓": "Decreasing"
+}
+
+
+def sdg_columns(color_data):
+    """Returns the SDG status columns of the Overview sheet and the trend column next to each."""
+    color_columns = [col for col in color_data.columns if col.startswith("SDG")]
+    trend_columns = [
+        color_data.columns[color_data.columns.get_loc(col) + 1]
+        if color_data.columns.get_loc(col) + 1 < len(color_data.columns)
+        else None
+        for col in color_columns
+    ]
+    return color_columns, trend_columns
+
+
+# Generate map
+def generate_map(selected_sdg_index):
+    return _build_map(selected_sdg_index, bundle.dataset_hash("sdr2024"))
+
+
+# Keyed by the content hash of the SDR data, so a new bundle gives new maps
+@st.cache_resource
+def _build_map(selected_sdg_index, data_version):
+    color_data = load_sdr_overview()
+    if color_data is None:
+        return None
+
+    color_columns, _ = sdg_columns(color_data)
+    current_sdg = color_columns[selected_sdg_index]
+    filtered_data = color_data[["Country", current_sdg]].dropna()
+    filtered_data.rename(columns={current_sdg: "Color"}, inplace=True)
+
+    import plotly.express as px  # Deferred: only the pages with charts pay for it
+
+    fig = px.choropleth(
+        filtered_data,
+        locations="Country",
+        locationmode="country names",
+        color="Color",
+        color_discrete_map=COLOR_HEX_MAPPING
+    )
+
+    # Country name only, read from the locations (no extra hovertext/customdata columns)
+    fig.update_traces(marker_line_width=0, hovertemplate="<b>%{location}</b><extra></extra>")
+    fig.update_layout(
+        margin={"r": 0, "t": 0, "l": 0, "b": 0},
+        paper_bgcolor="#f9f9f9",
+        plot_bgcolor="#f9f9f9",
+        showlegend=False,
+        dragmode=False,
+        annotations=[
+            dict(
+                x=0.94,  # Adjust x-coordinate for placement (right bottom)
+                y=0.001,  # Adjust y-coordinate for placement (bottom)
+                xref="paper",
+                yref="paper",
+                text="Status: 2024",  # The note text
+                showarrow=False,
+                font=dict(size=12, color="black"),
+                align="right"
+            )
+        ]
+    )
+    # Not compacted: plotly_events bundles plotly.js 1.58, which cannot decode typed arrays
+    return fig
+
+
+def clear_maps():
+    """Drops the cached SDG maps (after the SDR data changed)."""
+    _build_map.clear()
+
+
+# --- Figures of the fixed-content views, built at build time (see build.py) ---
+
+def income_comparison_figure(data, scale):
+    """Income percentiles of Germany and Brazil; scale is "linear" or "log"."""
+    import plotly.express as px
+
+    if scale == "linear":
+        title = "Comparison of Incomes in Germany and Brazil (Linear Scale)"
+        value_label = "Net Income (EUR)"
+    else:
+        title = "Logarithmic Comparison of Incomes in Germany and Brazil"
+        value_label = "Logarithmic Income (EUR)"
+    fig = px.line(
+        data,
+        x="IncomeGroup",
+        y="Value",
+        color="Country",
+        markers=True,
+        title=title,
+        labels={"IncomeGroup": "Percentiles", "Value": value_label},
+        # Real colors: importing streamlit makes its template (placeholder colors) the default
+        template="plotly_white"
+    )
+    return fig
+
+
+def energy_expenditure_figure(brazil_germany_data):
+    import plotly.express as px
+
+    # Beispiel: Auslesen der Spalten 3 und 4 und Multiplikation mit 100
+    data_to_plot = brazil_germany_data.iloc[0:10, [3, 4]]
+    data_to_plot = data_to_plot * 100
+    data_to_plot.columns = ['Brazil', 'Germany']
+
+    fig = px.bar(
+        data_to_plot,
+        x=data_to_plot.index,
+        y=data_to_plot.columns,
+        title="Brazil vs Germany Comparison (Percentage of Income Spent on Electricity)",
+        labels={"x": "Income Percentile Group", "y": "Percentage of income p.p. spent on electricity (%)"},
+        barmode='group',
+        height=400,
+        template="plotly_white"
+    )
+    fig.update_layout(
+        xaxis_title="Income Percentile Group",
+        yaxis_title="Percentage of Income Spent on Electricity",
+        yaxis=dict(
+            tickmode="array",
+            tickvals=[0, 10, 20, 30, 40, 50, 60, 70, 80, 90, 100],
+            ticktext=["0%", "10%", "20%", "30%", "40%", "50%", "60%", "70%", "80%", "90%", "100%"]
+        ),
+        xaxis=dict(
+            tickvals=[0, 1, 2, 3, 4, 5, 6, 7, 8, 9],
+            ticktext=["0-10%", "10-20%", "20-30%", "30-40%", "40-50%", "50-60%", "60-70%", "70-80%", "80-90%", "90-100%"]
+        )
+    )
+    return fig
+
+
+def data_availability_figure(data_availability):
+    import plotly.express as px
+
+    median_availability = data_availability["Data Availability (%)"].median()
+    fig = px.bar(
+        data_availability,
+        x="Goal",
+        y="Data Availability (%)",
+        title="Data Availability for Sustainable Development Goals",
+        labels={"Goal": "SDG", "Data Availability (%)": "Data Availability (%)"},
+        text_auto='.2f',
+        color="Data Availability (%)",
+        color_continuous_scale='RdYlGn',
+        template="plotly_white"
+    )
+    fig.add_hline(y=median_availability, line_dash="dot", line_color="blue", annotation_text="Median", annotation_position="bottom right")
+    fig.update_traces(textposition='outside')
+    fig.update_layout(yaxis=dict(range=[0, 100]))
+    return fig
+
+
+def data_availability_breakdown_figure(data_availability, by):
+    """Heatmap of the data availability per SDG and year or region."""
+    import plotly.express as px
+
+    table = data_availability.pivot(index="Goal", columns=by, values="Data Availability (%)")
+    fig = px.imshow(
+        table,
+        labels={"x": by, "y": "SDG", "color": "Data Availability (%)"},
+        title=f"Data Availability for Sustainable Development Goals by {by}",
+        color_continuous_scale='RdYlGn',
+        zmin=0,
+        zmax=100,
+        aspect="auto",
+        text_auto='.0f',
+    )
+    fig.update_xaxes(type="category")
+    fig.update_layout(template="plotly_white", height=600)
+    return fig
+
+
+# Per breakdown and dataset version; the table is passed in, not hashed
+@st.cache_resource
+def _build_availability_figure(_table, breakdown, data_version):
+    if breakdown is None:
+        return share_figure(data_availability_figure(_table))
+    return share_figure(data_availability_breakdown_figure(_table, breakdown))
+
+
+def availability_figure(table, breakdown=None):
+    """
+    Chart of a data availability table (see availability.py): bars per SDG,
+    or a heatmap per year or region. Shared by all sessions; do not modify it.
+    """
+    return _build_availability_figure(table, breakdown, bundle.dataset_hash(availability.dataset(breakdown)))
+
+
+def clear_availability_figures():
+    """Drops the data availability charts (after their datasets changed)."""
+    _build_availability_figure.clear()
+
+
+# Static figure -> (dataset, builder taking the dataset's tables {table: frame})
+STATIC_FIGURES = {
+    "income_linear": ("comparison_csvs", lambda tables: income_comparison_figure(tables["comparison_linear"], "linear")),
+    "income_log": ("comparison_csvs", lambda tables: income_comparison_figure(tables["comparison_log"], "log")),
+    "energy_expenditure": ("brazil_germany", lambda tables: energy_expenditure_figure(tables["brazil_germany"])),
+}
+
+
+# Built once per process and bundle version from the stored JSON
+@st.cache_resource
+def _load_static_figure(name, data_version):
+    return share_figure(pio.from_json(bundle.read_figure(name), skip_invalid=True))
+
+
+def clear_static_figures():
+    """Drops the loaded static figures (after their datasets changed)."""
+    _load_static_figure.clear()
+
+
+def static_figure(name):
+    """
+    A prebuilt figure of a fixed-content view, None (with an error) if it is
+    not in the bundle. The Figure is shared by all sessions; do not modify it.
+    """
+    dataset, _ = STATIC_FIGURES[name]
+    if not bundle.has_figure(name):
+        st.error(f"Figure '{name}' is not in the data bundle. Build it with 'python -m sdg_dashboard.build'.")
+        return None
+    return _load_static_figure(name, bundle.dataset_hash(dataset))
+
+
+# Numeric trace arrays that are sent to the browser
+ARRAY_PROPERTIES = (
+    "x", "y", "z", "lat", "lon",
+    "error_x.array", "error_x.arrayminus", "error_y.array", "error_y.arrayminus",
+    "marker.color", "marker.size",
+)
+
+
+def _compact_array(values):
+    """Smallest typed array for numeric values; None if they are not numeric."""
+    array = np.asarray(values)
+    if array.dtype.kind == "f":
+        return array.astype(np.float32, copy=False)
+    if array.dtype.kind in "iu" and array.size:
+        return array.astype(np.result_type(np.min_scalar_type(array.min()), np.min_scalar_type(array.max())), copy=False)
+    return None
+
+
+def _referenced(trace, name):
+    templates = " ".join(str(trace[key] or "") for key in ("hovertemplate", "texttemplate") if key in trace)
+    return f"%{{{name}" in templates
+
+
+def compact_figure(fig):
+    """
+    Shrinks the figure's payload in place: numeric arrays (and numeric
+    tuples, which would be sent as JSON text) become the smallest typed
+    arrays, which Plotly sends base64-encoded, and customdata/hovertext
+    that no template references are dropped. Returns the figure.
+    """
+    for trace in fig.data:
+        for name in ARRAY_PROPERTIES:
+            if name not in trace:
+                continue
+            values = trace[name]
+            if isinstance(values, (np.ndarray, tuple, list)) and len(values):
+                compact = _compact_array(values)
+                if compact is not None and (not isinstance(values, np.ndarray) or compact.dtype != values.dtype):
+                    trace[name] = None  # Plotly skips assignments of equal values
+                    trace[name] = compact
+        if "hovertemplate" in trace and trace.hovertemplate:
+            for name in ("customdata", "hovertext"):
+                if name in trace and trace[name] is not None and not _referenced(trace, name):
+                    trace[name] = None
+    return fig
+
+
+# Per-point properties that are thinned together with x and y
+POINT_PROPERTIES = (
+    "x", "y", "error_y.array", "error_y.arrayminus", "customdata", "hovertext", "text",
+    "marker.size", "marker.color",
+)
+
+
+def _is_plain_line(trace):
+    # Stacked/filled areas need aligned x values across traces, so they stay as they are
+    return (
+        trace.type in ("scatter", "scattergl")
+        and "lines" in (trace.mode or "lines")
+        and not getattr(trace, "fill", None)
+        and not getattr(trace, "stackgroup", None)
+        and trace.y is not None
+    )
+
+
+def _downsample_trace(trace, threshold):
+    y = np.asarray(trace.y, dtype=np.float64)
+    n = len(y)
+    x = np.asarray(trace.x) if trace.x is not None else np.arange(n)
+    if x.dtype.kind not in "iuf":
+        x = np.arange(n)  # Categorical x: use the positions
+    indices, gap_after = downsample_indices(x, y, threshold)
+    indices, gaps = expand_gaps(indices, gap_after)
+    for name in POINT_PROPERTIES:
+        values = trace[name] if name in trace else None
+        if values is None or isinstance(values, str) or np.ndim(values) != 1 or len(values) != n:
+            continue
+        thinned = np.asarray(values)[indices]
+        if name == "y":
+            thinned = thinned.astype(np.float64)
+            thinned[gaps] = np.nan
+        trace[name] = thinned
+
+
+def optimize_traces(fig):
+    """
+    Keeps many-series line charts interactive: series longer than MAX_POINTS
+    are downsampled with LTTB (see downsample.py), and above WEBGL_TRACES
+    line traces or WEBGL_POINTS points the lines are drawn with WebGL
+    (scattergl) instead of SVG. Returns the figure, a new one if the traces
+    were converted; figures that need neither are returned unchanged.
+    """
+    lines = [trace for trace in fig.data if _is_plain_line(trace)]
+    if not lines:
+        return fig
+    for trace in lines:
+        if len(trace.y) > MAX_POINTS:
+            _downsample_trace(trace, MAX_POINTS)
+
+    points = sum(len(trace.y) for trace in lines)
+    if len(lines) <= WEBGL_TRACES and points <= WEBGL_POINTS:
+        return fig
+    data = [
+        go.Scattergl({k: v for k, v in trace.to_plotly_json().items() if k != "type"}, skip_invalid=True)
+        if trace.type == "scatter" and _is_plain_line(trace) else trace
+        for trace in fig.data
+    ]
+    return go.Figure(data=data, layout=fig.layout)
+
+
+def payload_size(fig):
+    """Bytes of the figure's JSON as sent to the browser."""
+    return len(pio.to_json(fig, validate=False))
+
+
+def share_figure(fig):
+    """
+    Optimizes and compacts a figure once, before it is cached and shared by
+    all sessions, and marks it so that plotly_chart draws it as it is.
+    Rewriting a shared figure on every draw would let concurrent sessions
+    read half-rewritten traces. Use the returned figure: optimize_traces
+    returns a new one when it switches to WebGL.
+    """
+    fig = compact_figure(optimize_traces(fig))
+    fig._shared = True
+    return fig
+
+
+def plotly_chart(fig, **kwargs):
+    """
+    st.plotly_chart of the optimized and compacted figure, with a timing
+    span around the serialization. Figures of the session are optimized in
+    place; shared figures (share_figure) already are.
+    """
+    if not getattr(fig, "_shared", False):
+        fig = compact_figure(optimize_traces(fig))
+    with span("plotly_chart", chart=fig.layout.title.text or "untitled") as attrs:
+        if reporting_enabled():  # Costs one extra serialization
+            attrs["bytes"] = payload_size(fig)
+        st.plotly_chart(fig, **kwargs)
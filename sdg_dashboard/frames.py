@@ -0,0 +1,31 @@
+"""
+Zero-copy, read-only views of the shared dataset frames.
+
+The parsed datasets are held once per process (see cache.py). Instead of
+copying them for every caller, each caller gets a shallow view that shares
+the column buffers. pandas' Copy-on-Write keeps the shared frame immutable:
+assigning a column, ``.loc``/``.iloc`` writes or in-place methods on a view
+copy the affected data into the view first, and ``to_numpy()`` hands out
+read-only arrays. A line like
+
+    goal7_data["Indicator"] = goal7_data["Indicator"].str.strip()
+
+therefore only changes the caller's view, never the cached frame.
+"""
+
+import pandas as pd
+
+# Copy-on-Write is always on from pandas 3.0; earlier 2.x versions need the option
+if int(pd.__version__.split(".")[0]) < 3:
+    pd.set_option("mode.copy_on_write", True)
+
+
+def share(value):
+    """Returns a zero-copy view of a cached value (recursing into tuples and lists)."""
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        return value.copy(deep=False)
+    if isinstance(value, tuple):
+        return tuple(share(item) for item in value)
+    if isinstance(value, list):
+        return [share(item) for item in value]
+    return value
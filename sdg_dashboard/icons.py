@@ -0,0 +1,48 @@
+"""
+Pre-resized SDG icons for the button strip of the SDG dashboard.
+
+The PNGs in ``assets`` are about 220 px wide but are shown at 90 px (130 px
+for SDG 7). They are decoded and scaled down once, and the encoded bytes
+are kept in memory, so a rerun neither touches the disk nor ships the full
+size images to the browser.
+"""
+
+import io
+import os
+
+from PIL import Image
+
+ICON_DIR = "assets"
+SDG_COUNT = 17
+
+
+def icon_width(sdg_index):
+    """Display width of the icon below the SDG button (0-based index)."""
+    return 130 if sdg_index == 6 else 90
+
+
+def resize_icon(image_path, width):
+    """Scales a PNG to the given width and returns the encoded bytes."""
+    with Image.open(image_path) as image:
+        image.load()
+        height = max(1, round(image.height * width / image.width))
+        resized = image.resize((width, height), Image.LANCZOS)
+
+    buffer = io.BytesIO()
+    resized.save(buffer, format="PNG", optimize=True)
+    return buffer.getvalue()
+
+
+def load_sdg_icons(icon_dir=ICON_DIR):
+    """
+    Returns the resized icons for SDG 1-17 as a list of PNG bytes.
+    Missing files are returned as None, so the strip can skip them.
+    """
+    icons = []
+    for i in range(SDG_COUNT):
+        image_path = os.path.join(icon_dir, f"{i + 1}.png")
+        if os.path.exists(image_path):
+            icons.append(resize_icon(image_path, icon_width(i)))
+        else:
+            icons.append(None)
+    return icons
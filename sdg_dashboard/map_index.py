@@ -0,0 +1,240 @@
+"""
+Spatial index over the Natural Earth country polygons.
+
+Map clicks that only carry coordinates are resolved here: a packed
+bounding-box R-tree narrows a (lon, lat) point down to a handful of polygon
+rings, which are then checked with an even-odd point-in-polygon test.
+The index is built once from the shapefile in ``Data/map`` and reused for
+every click.
+"""
+
+import os
+import struct
+
+import numpy as np
+
+SHAPEFILE_PATH = os.path.join("Data", "map", "ne_110m_admin_0_countries.shp")
+
+# Attribute fields that can hold the name used in the SDR "Country" column,
+# in the order in which they are tried.
+NAME_FIELDS = ("NAME_LONG", "ADMIN", "NAME", "FORMAL_EN", "NAME_EN", "GEOUNIT", "SOVEREIGNT")
+
+# Maximum number of children per R-tree node
+NODE_CAPACITY = 8
+
+_POLYGON = 5
+
+
+def read_shapes(shp_path):
+    """
+    Reads the polygons of a shapefile (.shp).
+    Returns one list of rings per record; each ring is an (n, 2) array of
+    longitudes and latitudes.
+    """
+    with open(shp_path, "rb") as file:
+        content = file.read()
+
+    shape_type = struct.unpack("<i", content[32:36])[0]
+    if shape_type != _POLYGON:
+        raise ValueError(f"{shp_path} does not contain polygons (shape type {shape_type}).")
+
+    shapes = []
+    offset = 100
+    while offset < len(content):
+        _, length = struct.unpack(">ii", content[offset:offset + 8])
+        start = offset + 8
+        offset = start + 2 * length
+
+        record_type = struct.unpack("<i", content[start:start + 4])[0]
+        if record_type != _POLYGON:
+            shapes.append([])  # Null shape
+            continue
+
+        num_parts, num_points = struct.unpack("<ii", content[start + 36:start + 44])
+        parts_start = start + 44
+        points_start = parts_start + 4 * num_parts
+        parts = list(struct.unpack(f"<{num_parts}i", content[parts_start:points_start])) + [num_points]
+        points = np.frombuffer(content, dtype="<f8", count=2 * num_points, offset=points_start)
+        points = points.reshape(num_points, 2)
+        shapes.append([points[parts[i]:parts[i + 1]] for i in range(num_parts)])
+    return shapes
+
+
+def read_records(dbf_path, fields):
+    """
+    Reads the requested attribute fields of a dBASE file (.dbf).
+    Returns one {field: value} dictionary per record.
+    """
+    encoding = "utf-8"
+    cpg_path = os.path.splitext(dbf_path)[0] + ".cpg"
+    if os.path.exists(cpg_path):
+        with open(cpg_path, "r") as file:
+            encoding = file.read().strip() or encoding
+
+    with open(dbf_path, "rb") as file:
+        content = file.read()
+
+    num_records, header_length, record_length = struct.unpack("<IHH", content[4:12])
+
+    # Field descriptors: 32 bytes each, terminated by 0x0D
+    columns = {}
+    position = 1  # Skip the deletion flag of each record
+    descriptor = 32
+    while content[descriptor] != 0x0D:
+        name = content[descriptor:descriptor + 11].split(b"\0")[0].decode("ascii")
+        width = content[descriptor + 16]
+        columns[name] = (position, width)
+        position += width
+        descriptor += 32
+
+    records = []
+    for i in range(num_records):
+        start = header_length + i * record_length
+        record = {}
+        for field in fields:
+            if field in columns:
+                field_offset, width = columns[field]
+                raw = content[start + field_offset:start + field_offset + width]
+                record[field] = raw.decode(encoding, errors="replace").strip("\x00 ")
+        records.append(record)
+    return records
+
+
+def _ring_contains(ring, lon, lat):
+    """Ray casting test for a single closed ring."""
+    x1, y1 = ring[:-1, 0], ring[:-1, 1]
+    x2, y2 = ring[1:, 0], ring[1:, 1]
+    crosses = (y1 > lat) != (y2 > lat)
+    if not crosses.any():
+        return False
+    x1, y1, x2, y2 = x1[crosses], y1[crosses], x2[crosses], y2[crosses]
+    x_intersect = x1 + (lat - y1) * (x2 - x1) / (y2 - y1)
+    return bool(np.count_nonzero(lon < x_intersect) % 2)
+
+
+def _pack(entries):
+    """Sort-Tile-Recursive packing of one R-tree level."""
+    count = len(entries)
+    leaves = -(-count // NODE_CAPACITY)
+    slices = max(1, int(np.ceil(np.sqrt(leaves))))
+    per_slice = slices * NODE_CAPACITY
+
+    entries = sorted(entries, key=lambda e: e[0] + e[2])
+    nodes = []
+    for i in range(0, count, per_slice):
+        vertical = sorted(entries[i:i + per_slice], key=lambda e: e[1] + e[3])
+        for j in range(0, len(vertical), NODE_CAPACITY):
+            children = vertical[j:j + NODE_CAPACITY]
+            nodes.append((
+                min(c[0] for c in children),
+                min(c[1] for c in children),
+                max(c[2] for c in children),
+                max(c[3] for c in children),
+                children,
+            ))
+    return nodes
+
+
+class CountryIndex:
+    """
+    R-tree over the bounding boxes of all polygon rings, plus the rings
+    themselves for the exact point-in-polygon test.
+    """
+
+    def __init__(self, shapes, names):
+        self.shapes = shapes
+        self.names = names
+
+        entries = []
+        for shape_id, rings in enumerate(shapes):
+            for ring in rings:
+                minx, miny = ring.min(axis=0)
+                maxx, maxy = ring.max(axis=0)
+                entries.append((float(minx), float(miny), float(maxx), float(maxy), shape_id))
+
+        self.size = len(entries)
+        level = entries
+        while len(level) > NODE_CAPACITY:
+            level = _pack(level)
+        self.root = (
+            min((e[0] for e in level), default=0.0),
+            min((e[1] for e in level), default=0.0),
+            max((e[2] for e in level), default=0.0),
+            max((e[3] for e in level), default=0.0),
+            level,
+        )
+
+    @classmethod
+    def from_shapefile(cls, shp_path=SHAPEFILE_PATH):
+        shapes = read_shapes(shp_path)
+        records = read_records(os.path.splitext(shp_path)[0] + ".dbf", NAME_FIELDS)
+        names = [
+            [record[field] for field in NAME_FIELDS if record.get(field)]
+            for record in records
+        ]
+        return cls(shapes, names)
+
+    def _candidates(self, lon, lat):
+        """Shape ids whose ring bounding boxes contain the point."""
+        found = set()
+        stack = [self.root]
+        while stack:
+            minx, miny, maxx, maxy, children = stack.pop()
+            if not (minx <= lon <= maxx and miny <= lat <= maxy):
+                continue
+            for child in children:
+                if isinstance(child[4], list):
+                    stack.append(child)
+                elif child[0] <= lon <= child[2] and child[1] <= lat <= child[3]:
+                    found.add(child[4])
+        return found
+
+    def shape_at(self, lon, lat):
+        """Returns the id of the shape containing the point, or None."""
+        for shape_id in self._candidates(lon, lat):
+            inside = False
+            for ring in self.shapes[shape_id]:
+                if _ring_contains(ring, lon, lat):
+                    inside = not inside  # Holes are counted even-odd
+            if inside:
+                return shape_id
+        return None
+
+    def country_at(self, lon, lat, known_countries=None):
+        """
+        Returns the country name at (lon, lat). If known_countries is given,
+        the first name variant that appears in it (case-insensitive) is
+        returned, so the result matches the options of the country dropdown.
+        """
+        shape_id = self.shape_at(lon, lat)
+        if shape_id is None:
+            return None
+        names = self.names[shape_id]
+        if known_countries is None:
+            return names[0] if names else None
+
+        lookup = {str(country).casefold(): country for country in known_countries}
+        for name in names:
+            if name.casefold() in lookup:
+                return lookup[name.casefold()]
+        return None
+
+
+def country_from_click(event, fig, index, known_countries=None):
+    """
+    Resolves a click event from streamlit-plotly-events to a country name.
+    Events that reference a choropleth point are looked up in the figure;
+    events that only carry coordinates go through the spatial index.
+    """
+    curve = event.get("curveNumber")
+    point = event.get("pointIndex", event.get("pointNumber"))
+    if curve is not None and point is not None and curve < len(fig.data):
+        locations = getattr(fig.data[curve], "locations", None)
+        if locations is not None and point < len(locations):
+            return locations[point]
+
+    lon = event.get("lon", event.get("x"))
+    lat = event.get("lat", event.get("y"))
+    if lon is None or lat is None:
+        return None
+    return index.country_at(float(lon), float(lat), known_countries)
@@ -0,0 +1,137 @@
+"""
+Timing spans for the stages of a rerun.
+
+Wrap a stage in ``span(...)`` to time it:
+
+    with span("filter", dataset="goal7"):
+        filtered_data = goal7_data[...]
+
+Every finished span is logged as one JSON line on the
+``sdg_dashboard.metrics`` logger (printed to stderr when ``SDG_SPAN_LOG=1``)
+and kept in the session, where the opt-in debug panel in the sidebar shows
+the spans of the latest rerun, together with the size, hits and misses of
+the dataset cache. The panel is enabled with ``?debug=1`` in the
+URL or ``SDG_DEBUG=1`` in the environment.
+"""
+
+import functools
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+
+import streamlit as st
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+from sdg_dashboard.cache import dataset_cache
+
+_LOGGER = logging.getLogger(__name__)
+SPAN_LOG = os.environ.get("SDG_SPAN_LOG") == "1"
+if SPAN_LOG:
+    _handler = logging.StreamHandler(sys.stderr)
+    _handler.setFormatter(logging.Formatter("%(message)s"))
+    _LOGGER.addHandler(_handler)
+    _LOGGER.setLevel(logging.INFO)
+
+_SPANS_KEY = "_metrics_spans"
+_RERUN_START_KEY = "_metrics_rerun_start"
+
+# Number of times each cached loader body actually ran (i.e. cache misses)
+_misses = {}
+_misses_lock = threading.Lock()
+
+
+def track_misses(func):
+    """
+    Counts how often a cached function computes its value. Put it below the
+    caching decorator, so only cache misses reach it.
+    """
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        with _misses_lock:
+            _misses[func.__name__] = _misses.get(func.__name__, 0) + 1
+        return func(*args, **kwargs)
+    return wrapper
+
+
+def miss_count(func):
+    """Cache misses so far of a function decorated with track_misses."""
+    return _misses.get(getattr(func, "__name__", ""), 0)
+
+
+def _session_spans():
+    # Spans from threads without a session (warm-up, loader pool) are only logged
+    if get_script_run_ctx() is None:
+        return None
+    return st.session_state.setdefault(_SPANS_KEY, [])
+
+
+def begin_rerun():
+    """Starts a new rerun: clears the spans of the previous one."""
+    if get_script_run_ctx() is None:
+        return
+    st.session_state[_SPANS_KEY] = []
+    st.session_state[_RERUN_START_KEY] = time.perf_counter()
+
+
+@contextmanager
+def span(name, **attrs):
+    """
+    Times the enclosed block. The yielded dict can be used to attach
+    attributes that are only known at the end (e.g. cache hit or miss).
+    """
+    started = time.perf_counter()
+    try:
+        yield attrs
+    finally:
+        record = {"span": name, "ms": round((time.perf_counter() - started) * 1000, 3), **attrs}
+        _LOGGER.info(json.dumps(record, default=str))
+        spans = _session_spans()
+        if spans is not None:
+            spans.append(record)
+
+
+def debug_enabled():
+    return os.environ.get("SDG_DEBUG") == "1" or st.query_params.get("debug") == "1"
+
+
+def reporting_enabled():
+    """True if spans are shown or logged; gates span attributes that are costly to compute."""
+    return SPAN_LOG or (get_script_run_ctx() is not None and debug_enabled())
+
+
+def render_debug_panel():
+    """Shows the spans of the latest rerun in the sidebar (opt-in)."""
+    if not debug_enabled():
+        return
+    spans = st.session_state.get(_SPANS_KEY, [])
+    started = st.session_state.get(_RERUN_START_KEY)
+    with st.sidebar.expander("Debug: rerun timings", expanded=True):
+        if started is not None:
+            st.write(f"Total rerun: {(time.perf_counter() - started) * 1000:.1f} ms")
+        if spans:
+            st.table([
+                {
+                    "span": record["span"],
+                    "ms": record["ms"],
+                    "details": ", ".join(f"{key}={value}" for key, value in record.items() if key not in ("span", "ms")),
+                }
+                for record in spans
+            ])
+        else:
+            st.write("No spans recorded.")
+
+        summary = dataset_cache.summary()
+        st.write(
+            f"Dataset cache: {summary['bytes'] / 1024 ** 2:.1f} of {summary['budget'] / 1024 ** 2:.0f} MB, "
+            f"{summary['entries']} entries, {summary['evictions']} evictions"
+        )
+        st.table([
+            {"dataset": entry["name"], "version": (entry["version"] or "")[:8],
+             "MB": round(entry["bytes"] / 1024 ** 2, 2),
+             "hits": entry["hits"], "misses": entry["misses"]}
+            for entry in dataset_cache.stats()
+        ])
@@ -0,0 +1,125 @@
+"""
+Opt-in sampling profiler for reruns.
+
+When ``?profile=1`` is in the URL (that session only) or ``SDG_PROFILE=1`` is
+set (every session), each rerun runs under a sampler thread that reads the
+script thread's stack every few milliseconds with ``sys._current_frames()``.
+The script itself is not instrumented, so the overhead stays small.
+
+Each rerun is written as a collapsed-stack file (one ``frame;frame;... count``
+line per stack), which both ``flamegraph.pl`` and https://www.speedscope.app
+open directly:
+
+    profiles/<page>/<timestamp>.folded
+
+The directory is ``SDG_PROFILE_DIR`` (default ``profiles``) and the sampling
+interval ``SDG_PROFILE_INTERVAL_MS`` (default 5).
+"""
+
+import os
+import re
+import sys
+import threading
+from collections import Counter
+from datetime import datetime
+
+import streamlit as st
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+PROFILE_DIR = os.environ.get("SDG_PROFILE_DIR", "profiles")
+INTERVAL = float(os.environ.get("SDG_PROFILE_INTERVAL_MS", "5")) / 1000
+
+_PROFILER_KEY = "_profiler"
+
+
+def _frame_label(code):
+    filename = code.co_filename
+    for prefix in sys.path:
+        if prefix and filename.startswith(prefix):
+            filename = filename[len(prefix):].lstrip(os.sep)
+            break
+    return f"{code.co_name} ({filename}:{code.co_firstlineno})"
+
+
+class SamplingProfiler:
+    """Samples the stack of one thread until stopped."""
+
+    def __init__(self, thread_id, page, interval=INTERVAL):
+        self.thread_id = thread_id
+        self.page = page
+        self.interval = interval
+        self.samples = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._sample, name="sdg-profiler", daemon=True)
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def _sample(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is None:
+                continue
+            stack = []
+            while frame is not None:
+                stack.append(_frame_label(frame.f_code))
+                frame = frame.f_back
+            self.samples[";".join(reversed(stack))] += 1
+
+    def stop(self):
+        """Stops sampling; returns False if it was already stopped."""
+        if self._stop.is_set():
+            return False
+        self._stop.set()
+        self._thread.join()
+        return True
+
+    def write(self, profile_dir=PROFILE_DIR):
+        """Writes the collapsed stacks; returns the file path (None without samples)."""
+        if not self.samples:
+            return None
+        page_dir = os.path.join(profile_dir, re.sub(r"[^\w.-]+", "_", self.page))
+        os.makedirs(page_dir, exist_ok=True)
+        path = os.path.join(page_dir, datetime.now().strftime("%Y%m%d-%H%M%S-%f") + ".folded")
+        with open(path, "w") as file:
+            for stack, count in self.samples.items():
+                file.write(f"{stack} {count}\n")
+        return path
+
+
+def profiling_enabled():
+    return os.environ.get("SDG_PROFILE") == "1" or st.query_params.get("profile") == "1"
+
+
+def _finish(profiler):
+    if profiler.stop():
+        profiler.write()
+
+
+def start_rerun(page):
+    """
+    Starts profiling this rerun if enabled and returns the profiler (None
+    if disabled) for finish_rerun. A capture that is still running (the
+    previous rerun ended before finish_rerun) is written first.
+    """
+    if get_script_run_ctx() is None:
+        return None
+    previous = st.session_state.pop(_PROFILER_KEY, None)
+    if previous is not None:
+        _finish(previous)
+    if not profiling_enabled():
+        return None
+    profiler = SamplingProfiler(threading.get_ident(), page).start()
+    st.session_state[_PROFILER_KEY] = profiler
+    return profiler
+
+
+def finish_rerun(profiler):
+    """
+    Stops the capture of this rerun and writes it. Takes the profiler from
+    start_rerun: after st.stop() every access to st.session_state raises
+    StopException again.
+    """
+    if profiler is not None:
+        _finish(profiler)
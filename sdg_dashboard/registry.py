@@ -0,0 +1,124 @@
+"""
+Registry of the independent datasets, loaded concurrently.
+
+Each dataset is fetched by its cached loader on a bounded thread pool.
+Loads that are already running are shared: a second session (or the
+warm-up) asking for the same dataset waits for the running load instead
+of starting its own. Once a load has finished, get() returns the value
+from the loader's cache without going through the pool, so reruns do not
+queue behind slow loads; loading everything takes about as long as the
+slowest file.
+"""
+
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait
+
+from sdg_dashboard import data
+from sdg_dashboard.cache import NOT_CACHED
+from sdg_dashboard.metrics import miss_count, span
+
+# Upper bound for concurrent file parses
+MAX_WORKERS = int(os.environ.get("SDG_LOADER_THREADS", "4"))
+
+DATASETS = {
+    "sdr2024": data.load_sdr_overview,  # The Full Database is loaded on demand
+    "goal7": data.load_goal7_data,
+    "elecloss2": data.load_elecloss2_data,
+    "sdg_index": data.load_sdg_index,
+    "comparison_csvs": data.load_comparison_csvs,
+    "brazil_germany": data.load_brazil_germany_comparison_data,
+}
+
+
+class Missing:
+    """
+    Result of a worker whose dataset is not in the bundle. The worker has no
+    ScriptRunContext, so get() reports it on the script thread.
+    """
+
+    def __init__(self, value):
+        self.value = value  # What the loader returned: None or a tuple of Nones
+
+
+_executor = ThreadPoolExecutor(max_workers=MAX_WORKERS, thread_name_prefix="sdg-loader")
+_lock = threading.RLock()  # Done callbacks may run while it is held
+_in_flight = {}
+
+
+def register(name, loader):
+    """Adds a dataset to the registry."""
+    DATASETS[name] = loader
+
+
+def _load(name):
+    value = DATASETS[name]()
+    if value is None or (isinstance(value, tuple) and all(item is None for item in value)):
+        return Missing(value)
+    return value
+
+
+def _finished(name, future):
+    with _lock:
+        if _in_flight.get(name) is future:
+            del _in_flight[name]
+
+
+def prefetch(names=None):
+    """
+    Starts loading the given datasets (all if None) without waiting.
+    Returns {name: Future}; datasets that are already loading reuse the
+    running Future.
+    """
+    futures = {}
+    with _lock:
+        for name in DATASETS if names is None else names:
+            future = _in_flight.get(name)
+            if future is None:
+                future = _executor.submit(_load, name)
+                _in_flight[name] = future
+                future.add_done_callback(lambda f, name=name: _finished(name, f))
+            futures[name] = future
+    return futures
+
+
+def get(name):
+    """
+    Returns the dataset (None if it is missing). A cached dataset is
+    returned directly; otherwise it is loaded on the pool, sharing a load
+    that is already in flight.
+    """
+    loader = DATASETS[name]
+    with span("load", dataset=name) as attrs:
+        cached = getattr(loader, "cached", None)  # Loaders added with register() may not have it
+        value = NOT_CACHED if cached is None else cached()
+        if value is not NOT_CACHED:
+            attrs["cache"] = "hit"
+            return value
+        misses = miss_count(loader)
+        result = prefetch([name])[name].result()  # Raises the loader's error, if any
+        if isinstance(result, Missing):
+            data.report_missing(name)
+            return result.value
+        value = loader()  # Served from the loader's cache
+        attrs["cache"] = "miss" if miss_count(loader) > misses else "hit"
+    return value
+
+
+def _error(name, future):
+    """The loader's exception, a LookupError if the dataset is not in the bundle, else None."""
+    if future.exception() is not None:
+        return future.exception()
+    if isinstance(future.result(), Missing):
+        return LookupError(f"Dataset '{name}' is not in the data bundle")
+    return None
+
+
+def load_all(names=None):
+    """
+    Loads the given datasets (all if None) in parallel and waits for them.
+    Returns {name: exception or None}; a missing dataset is a LookupError.
+    """
+    futures = prefetch(names)
+    wait(futures.values())
+    return {name: _error(name, future) for name, future in futures.items()}
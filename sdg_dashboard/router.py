@@ -0,0 +1,105 @@
+"""
+Page router of the app.
+
+The page a session is on is a single value in the session state
+(``page``). Navigation buttons switch it in their ``on_click`` callback.
+Streamlit runs callbacks before the rerun that a click triggers, so that
+rerun already draws the new page: one click, one rerun. Setting the state
+in the body of ``if st.button(...)`` only took effect on the following
+rerun, which is why those buttons needed a second click or an extra
+``st.rerun()``.
+
+Each page is a module in ``sdg_dashboard/views`` with a ``render()``,
+imported the first time a session is routed to it, and declares the
+datasets it reads (see registry.py). They are loaded when the page
+renders, not when the script starts, so the landing survey needs no data
+at all.
+"""
+
+import importlib
+
+import streamlit as st
+
+SURVEY = "survey"
+SDG_MAP = "sdg_map"
+DASHBOARDS = "dashboards"
+RESULTS = "results"
+
+# Page -> module that renders it
+PAGE_MODULES = {
+    SURVEY: "sdg_dashboard.views.survey",
+    SDG_MAP: "sdg_dashboard.views.sdg_map",
+    DASHBOARDS: "sdg_dashboard.views.dashboards",
+    RESULTS: "sdg_dashboard.views.results",
+}
+PAGES = tuple(PAGE_MODULES)
+
+# Views of the dashboards page, in the order of the sidebar
+VIEW_MODULES = {
+    "Indicator Dashboard": "sdg_dashboard.views.indicator",
+    "Electricity Loss Comparison": "sdg_dashboard.views.electricity_loss",
+    "Brazil Germany Comparison": "sdg_dashboard.views.brazil_germany",
+    "Data Availability": "sdg_dashboard.views.data_availability",
+}
+
+# Datasets per page; the dashboards page by the view chosen in its sidebar
+PAGE_DATASETS = {
+    SURVEY: (),
+    SDG_MAP: ("sdr2024",),
+    RESULTS: (),
+}
+VIEW_DATASETS = {
+    "Indicator Dashboard": ("goal7",),
+    "Electricity Loss Comparison": ("elecloss2",),
+    "Brazil Germany Comparison": (),  # Prebuilt figures only
+    "Data Availability": (),  # Computed from the Full Database and the SDG index (availability.py)
+}
+
+
+def current_page():
+    """The page of this session (the survey for new sessions)."""
+    return st.session_state.setdefault("page", SURVEY)
+
+
+# Name der Seite, die dieser Durchlauf anzeigt (für die Profiler-Ausgabe)
+def page_name():
+    page = current_page()
+    if page == DASHBOARDS:
+        return st.session_state.get("dashboard_choice", "Indicator Dashboard")
+    return {SURVEY: "Survey", SDG_MAP: "SDG map", RESULTS: "Results"}[page]
+
+
+def render(page):
+    """Draws the page; its module is imported on first use."""
+    importlib.import_module(PAGE_MODULES[page]).render()
+
+
+def render_view(view):
+    """Draws a view of the dashboards page; its module is imported on first use."""
+    importlib.import_module(VIEW_MODULES[view]).render()
+
+
+def navigate(page, before=None):
+    """Switches the session to page; before runs first (e.g. to store form input)."""
+    if page not in PAGES:
+        raise ValueError(f"Unknown page {page!r}")
+    if before is not None:
+        before()
+    st.session_state.page = page
+
+
+def nav_button(label, page, before=None, container=st, **kwargs):
+    """A button that switches to page when clicked; kwargs go to st.button."""
+    return container.button(label, on_click=navigate, args=(page, before), **kwargs)
+
+
+def page_data(page, view=None):
+    """
+    Loads the datasets of a page (of a view of the dashboards page) in
+    parallel and returns {dataset: value}.
+    """
+    from sdg_dashboard import registry  # pandas and pyarrow, only for pages with data
+
+    names = VIEW_DATASETS[view] if page == DASHBOARDS else PAGE_DATASETS[page]
+    registry.prefetch(names)
+    return {name: registry.get(name) for name in names}
@@ -0,0 +1,35 @@
+"""
+Starts the background services of a process without delaying its first page.
+
+The warm-up (warmup.py) and the data watcher (watcher.py) import the data
+and plotting stack (pandas, pyarrow, plotly). ``start()`` imports and
+starts them on a short-lived thread, so the first rerun, e.g. of the
+landing survey, does not wait for those imports.
+"""
+
+import os
+import threading
+
+_lock = threading.Lock()
+_started = False
+
+
+def _start_services():
+    from sdg_dashboard import warmup, watcher
+
+    # Caches im Hintergrund füllen (nur beim ersten Aufruf im Prozess)
+    warmup.start()
+    # Geänderte Datensätze ohne Neustart nachladen
+    watcher.start()
+
+
+def start():
+    """Starts the warm-up and the watcher once per process; later calls do nothing."""
+    global _started
+    with _lock:
+        if _started:
+            return
+        _started = True
+    if os.environ.get("SDG_WARMUP") == "0" and os.environ.get("SDG_WATCH") == "0":
+        return  # Both disabled, e.g. in the benchmarks
+    threading.Thread(target=_start_services, name="sdg-startup", daemon=True).start()
@@ -0,0 +1,221 @@
+"""
+Synthetic, schema-identical datasets for load and scaling tests.
+
+Writes scaled-up versions of the files in ``Data/`` into a directory that
+can be compiled into a bundle for the dashboard (see build.py):
+
+    python -m sdg_dashboard.synth /tmp/sdg-data --geo-areas 1000 --years 25 --indicators 100
+    python benchmarks/bench_pages.py --data-dir /tmp/sdg-data
+
+An Excel sheet holds at most 1,048,576 rows, which caps Goal7.xlsx at about
+geo areas x years x 6 indicators < 1M. Larger scales skip the Excel file
+and compile Goal7 straight into a bundle:
+
+    python -m sdg_dashboard.synth /tmp/sdg-data --geo-areas 10000 --years 100 --indicators 200 --bundle /tmp/sdg-bundle
+    SDG_BUNDLE_DIR=/tmp/sdg-bundle python benchmarks/bench_pages.py
+
+Generated files: SDR2024-data.xlsx (Overview and Full Database sheets),
+Goal7.xlsx (unless ``--bundle``), elecloss2.csv and sdg_index_2000-2022.csv.
+The small static files (Brazil/Germany comparison, income percentiles) are
+copied from ``Data/`` so every page of the dashboard has its input.
+"""
+
+import argparse
+import os
+import shutil
+
+import numpy as np
+import pandas as pd
+
+SOURCE_DIR = "Data"
+STATIC_FILES = (
+    "Brazil Germany Comparison .xlsx",
+    "Linear.csv",
+    "Log.csv",
+)
+
+# Names the dashboard uses as defaults in its multiselects
+REAL_COUNTRIES = ("Brazil", "Germany", "World")
+
+# Excel's maximum number of rows per sheet
+EXCEL_MAX_ROWS = 1_048_576
+
+GOAL7_INDICATORS = ("7.1.1", "7.1.2", "7.2.1", "7.3.1", "7.a.1", "7.b.1")
+TECHNOLOGIES = ("Solar", "Wind", "Hydropower", "Bioenergy")
+COLORS = ("green", "yellow", "orange", "red", "grey")
+TRENDS = ("↑", "➚", "→", "↓", "•")
+REGIONS = ("OECD", "East & South Asia", "Eastern Europe & Central Asia", "Latin America & the Caribbean",
+           "Middle East & North Africa", "Oceania", "Sub-Saharan Africa")
+
+
+def geo_areas(count):
+    """Country names and ISO3-like codes; the first ones are real names."""
+    names = list(REAL_COUNTRIES[:count]) + [f"Country {i:05d}" for i in range(len(REAL_COUNTRIES), count)]
+    codes = [f"{chr(65 + i // 676 % 26)}{chr(65 + i // 26 % 26)}{chr(65 + i % 26)}" for i in range(count)]
+    return names, codes
+
+
+def _check_excel_rows(rows, file_name):
+    if rows + 1 > EXCEL_MAX_ROWS:
+        raise ValueError(
+            f"{file_name} would have {rows:,} rows, more than an Excel sheet can hold "
+            f"({EXCEL_MAX_ROWS - 1:,}). Use fewer geo areas, years or indicators, or --bundle."
+        )
+
+
+def _with_missing(rng, values, missing_rate):
+    values = values.astype(float)
+    values[rng.random(values.shape) < missing_rate] = np.nan
+    return values
+
+
+def sdr_workbook(rng, names, codes, indicators, missing_rate):
+    """Overview (status and trend per SDG) and Full Database (indicators per country) sheets."""
+    count = len(names)
+    overview = {"Country": names}
+    for goal in range(1, 18):
+        overview[f"SDG{goal}"] = rng.choice(COLORS, count)
+        overview[f"SDG{goal} Trend"] = rng.choice(TRENDS, count)
+
+    full = {
+        "id": codes,
+        "Country": names,
+        "Regions used for the SDR": rng.choice(REGIONS, count),
+        "SDG Index Score": np.round(rng.uniform(30, 90, count), 1),
+    }
+    for i in range(indicators):
+        goal = i % 17 + 1
+        full[f"sdg{goal}_ind{i // 17 + 1}"] = _with_missing(rng, rng.uniform(0, 100, count), missing_rate)
+    return pd.DataFrame(overview), pd.DataFrame(full)
+
+
+def goal7_frame(rng, names, codes, years, series_per_indicator):
+    """Long format: one row per indicator series, geo area and year."""
+    time_periods = np.arange(2000, 2000 + years)
+    frames = []
+    for indicator in GOAL7_INDICATORS:
+        for series in range(series_per_indicator):
+            count = len(names) * years
+            frame = pd.DataFrame({
+                "Goal": 7,
+                "Target": indicator.rsplit(".", 1)[0],
+                "Indicator": indicator,
+                "SeriesCode": f"SYN_{indicator.replace('.', '_')}_{series}",
+                "GeoAreaCode": np.repeat(codes, years),
+                "GeoAreaName": np.repeat(names, years),
+                "TimePeriod": np.tile(time_periods, len(names)),
+                "Value": np.round(rng.uniform(0, 100, count), 2),
+                "Location": rng.choice(("ALLAREA", "URBAN", "RURAL"), count),
+                "Type of renewable technology": rng.choice(TECHNOLOGIES, count),
+            })
+            frame["UpperBou"] = frame["Value"] + 2
+            frame["LowerBou"] = frame["Value"] - 2
+            frames.append(frame)
+    return pd.concat(frames, ignore_index=True)
+
+
+def write_elecloss2(path, rng, names, codes, years, missing_rate):
+    """World Bank WDI layout: four preamble lines, one column per year, trailing empty column."""
+    year_columns = [str(year) for year in range(1960, 1960 + years)]
+    frame = pd.DataFrame({
+        "Country Name": names,
+        "Country Code": codes,
+        "Indicator Name": "Electric power transmission and distribution losses (% of output)",
+        "Indicator Code": "EG.ELC.LOSS.ZS",
+    })
+    values = _with_missing(rng, rng.uniform(1, 40, (len(names), years)), missing_rate)
+    frame = pd.concat([frame, pd.DataFrame(np.round(values, 2), columns=year_columns)], axis=1)
+    frame[""] = ""
+
+    with open(path, "w", encoding="utf-8-sig", newline="") as file:
+        file.write('"Data Source","World Development Indicators",\n\n')
+        file.write('"Last Updated Date","2024-11-13",\n\n')
+        frame.to_csv(file, index=False, quoting=1)
+
+
+def sdg_index_frame(rng, names, codes, years, missing_rate):
+    """One row per country and year with the index and the 17 goal scores."""
+    count = len(names) * years
+    frame = pd.DataFrame({
+        "country_code": np.repeat(codes, years),
+        "country": np.repeat(names, years),
+        "year": np.tile(np.arange(2000, 2000 + years), len(names)),
+        "sdg_index_score": np.round(rng.uniform(30, 90, count), 1),
+    })
+    for goal in range(1, 18):
+        frame[f"goal_{goal}_score"] = _with_missing(rng, np.round(rng.uniform(0, 100, count), 1), missing_rate)
+    return frame
+
+
+def generate(out_dir, geo_area_count, years, indicators, missing_rate=0.1, seed=0, bundle_dir=None):
+    """
+    Writes all synthetic datasets into out_dir and returns their paths. With
+    bundle_dir, Goal7 is not written as Excel (which limits its rows) but
+    compiled into a bundle in bundle_dir together with the other files.
+    """
+    rng = np.random.default_rng(seed)
+    names, codes = geo_areas(geo_area_count)
+    series_per_indicator = max(1, indicators // (17 * len(GOAL7_INDICATORS)))
+    if bundle_dir is None:
+        _check_excel_rows(geo_area_count * years * len(GOAL7_INDICATORS) * series_per_indicator, "Goal7.xlsx")
+    os.makedirs(out_dir, exist_ok=True)
+
+    paths = []
+    overview, full = sdr_workbook(rng, names, codes, indicators, missing_rate)
+    path = os.path.join(out_dir, "SDR2024-data.xlsx")
+    with pd.ExcelWriter(path, engine="openpyxl") as writer:
+        full.to_excel(writer, sheet_name="Full Database", index=False)
+        overview.to_excel(writer, sheet_name="Overview", index=False)
+    paths.append(path)
+
+    goal7 = goal7_frame(rng, names, codes, years, series_per_indicator)
+    if bundle_dir is None:
+        path = os.path.join(out_dir, "Goal7.xlsx")
+        goal7.to_excel(path, index=False, engine="openpyxl")
+        paths.append(path)
+
+    path = os.path.join(out_dir, "elecloss2.csv")
+    write_elecloss2(path, rng, names, codes, years, missing_rate)
+    paths.append(path)
+
+    path = os.path.join(out_dir, "sdg_index_2000-2022.csv")
+    sdg_index_frame(rng, names, codes, years, missing_rate).to_csv(path, index=False, encoding="utf-8-sig")
+    paths.append(path)
+
+    for file_name in STATIC_FILES:
+        source = os.path.join(SOURCE_DIR, file_name)
+        if os.path.exists(source):
+            shutil.copyfile(source, os.path.join(out_dir, file_name))
+            paths.append(os.path.join(out_dir, file_name))
+
+    if bundle_dir is not None:
+        from sdg_dashboard import build  # Imports the plotting stack for the prebuilt figures
+
+        builders = {**build.DATASETS, "goal7": (lambda data_dir: {"goal7": goal7}, [])}
+        manifest = build.build(out_dir, bundle_dir, full=True, datasets=builders)
+        paths.append(os.path.join(bundle_dir, manifest["version"]))
+    return paths
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate synthetic SDG dashboard datasets.")
+    parser.add_argument("out_dir")
+    parser.add_argument("--geo-areas", type=int, default=1000)
+    parser.add_argument("--years", type=int, default=25)
+    parser.add_argument("--indicators", type=int, default=100,
+                        help="Indicator columns in the Full Database; also scales the Goal7 series")
+    parser.add_argument("--missing-rate", type=float, default=0.1)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--bundle", help="Also compile a bundle into this directory; Goal7 then has no Excel row limit")
+    args = parser.parse_args(argv)
+
+    for path in generate(args.out_dir, args.geo_areas, args.years, args.indicators,
+                         args.missing_rate, args.seed, args.bundle):
+        if os.path.isdir(path):
+            print(f"{path}: bundle version")
+        else:
+            print(f"{path}: {os.path.getsize(path):,} bytes")
+
+
+if __name__ == "__main__":
+    main()
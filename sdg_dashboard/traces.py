@@ -0,0 +1,238 @@
+"""
+Line charts that are patched, not rebuilt, when the country selection changes.
+
+The Indicator and Electricity Loss views draw one line (or one line per
+location) per selected country. Instead of filtering the dataset and
+building the whole figure again for every selection, each session keeps
+its figure in ``st.session_state`` and the traces of every country are
+built once per process and dataset version and then shared:
+
+- adding a country appends its cached traces to the session's figure,
+- removing a country drops its traces,
+- countries that stay keep their traces and their color.
+
+The cost of a selection change is therefore proportional to the countries
+that changed, not to the whole selection. Serializing the figure for the
+browser (see figures.plotly_chart) still covers all traces.
+"""
+
+from functools import partial
+
+import numpy as np
+import plotly.graph_objects as go
+import streamlit as st
+from plotly.colors import qualitative
+
+from sdg_dashboard import bundle
+from sdg_dashboard.metrics import span
+
+PALETTE = qualitative.Plotly
+
+# Goal 7 indicators drawn as line charts (7.a.1 and 7.b.1 are area and bar charts)
+INDICATOR_CHARTS = {
+    "7.1.1": {
+        "title": "Access to Electricity (by Location and Country)",
+        "value_label": "Access Percentage",
+        "by_location": True,
+        "interpolate": True,
+    },
+    "7.1.2": {
+        "title": "Reliance on Clean Fuels (by Location and Country)",
+        "value_label": "Reliance Percentage",
+        "by_location": True,
+        "interpolate": True,
+        "error_bounds": True,
+    },
+    "7.2.1": {
+        "title": "Renewable Energy Share",
+        "value_label": "Renewable Energy Share (%)",
+        "interpolate": True,
+    },
+    "7.3.1": {
+        "title": "Energy Intensity Level (Primary Energy)",
+        "value_label": "Energy Intensity",
+    },
+}
+
+
+def indicator_figure(data, indicator):
+    """Line chart of one Goal 7 indicator for the countries in data."""
+    import plotly.express as px  # Deferred: only the pages with charts pay for it
+
+    chart = INDICATOR_CHARTS[indicator]
+    by_location = chart.get("by_location", False)
+    data = data.copy()
+    if chart.get("interpolate"):
+        # Along each line only, never across countries or locations
+        lines = ["GeoAreaName", "Location"] if by_location else ["GeoAreaName"]
+        data["Value"] = data.groupby(lines, observed=True)["Value"].transform(lambda s: s.interpolate(method="linear"))
+
+    # Handle error bounds gracefully without warning
+    error_y = None
+    error_y_minus = None
+    if chart.get("error_bounds") and "UpperBou" in data.columns and "LowerBou" in data.columns:
+        error_y = data["UpperBou"] - data["Value"]
+        error_y_minus = data["Value"] - data["LowerBou"]
+
+    fig = px.line(
+        data,
+        x="TimePeriod",
+        y="Value",
+        color="GeoAreaName",
+        line_dash="Location" if by_location else None,
+        # Same dash per location in every country's traces
+        category_orders={"Location": list(data["Location"].cat.categories)} if by_location else None,
+        error_y=error_y,
+        error_y_minus=error_y_minus,
+        labels={"TimePeriod": "Year", "Value": chart["value_label"]},
+        title=chart["title"],
+        markers=True
+    )
+    fig.update_layout(template="plotly_white")
+    return fig
+
+
+def electricity_loss_figure(data):
+    """Electricity loss per year for the countries in data."""
+    import plotly.express as px
+
+    fig = px.line(
+        data,
+        x="Year",
+        y="Electricity Loss (%)",
+        color="Country Name",
+        labels={"Year": "Year", "Electricity Loss (%)": "Electricity Loss (%)", "Country Name": "Country"},
+        title="Electric Power Transmission and Distribution Loss Comparison"
+    )
+    fig.update_layout(template="plotly_white")
+    return fig
+
+
+# View -> (dataset, columns the rows are grouped by, fixed leading key values,
+#          columns px splits the traces by, figure builder)
+LINE_VIEWS = {
+    **{
+        f"indicator {indicator}": (
+            "goal7",
+            ("Indicator", "GeoAreaName"),
+            (indicator,),
+            ("GeoAreaName", "Location") if chart.get("by_location") else ("GeoAreaName",),
+            partial(indicator_figure, indicator=indicator),
+        )
+        for indicator, chart in INDICATOR_CHARTS.items()
+    },
+    "electricity loss": ("elecloss2", ("Country Name",), (), ("Country Name",), electricity_loss_figure),
+}
+
+
+# Row positions per group (e.g. indicator and country), once per process and dataset version
+@st.cache_resource
+def _row_groups(_frame, dataset, data_version, columns):
+    return _frame.groupby(list(columns), observed=True, sort=False).indices
+
+
+def _rows(frame, view, data_version, country):
+    dataset, columns, prefix, _, _ = LINE_VIEWS[view]
+    key = (*prefix, country)
+    return _row_groups(frame, dataset, data_version, columns).get(key if len(key) > 1 else key[0])
+
+
+# Layout of a view (title, axis and legend titles); the same for every selection
+@st.cache_resource
+def _layout(_frame, view, data_version):
+    make_figure = LINE_VIEWS[view][4]
+    return make_figure(_frame.iloc[:1]).layout.to_plotly_json()
+
+
+# View and dataset version -> {country: traces as plain dicts}, shared by all sessions
+@st.cache_resource
+def _trace_store(view, data_version):
+    return {}
+
+
+def _country_traces(frame, view, data_version, countries):
+    """Traces per country; the ones not built yet are built with one figure for all of them."""
+    store = _trace_store(view, data_version)
+    missing = [country for country in countries if country not in store]
+    if missing:
+        _, _, _, trace_columns, make_figure = LINE_VIEWS[view]
+        rows = {country: _rows(frame, view, data_version, country) for country in missing}
+        built = {country: [] for country in missing}
+        subset = frame.iloc[np.concatenate([r for r in rows.values() if r is not None] or [np.array([], dtype=int)])]
+        # px names each trace after its values of trace_columns, joined with ", "
+        owner = {
+            ", ".join(str(value) for value in values): values[0]
+            for values in subset[list(trace_columns)].drop_duplicates().itertuples(index=False)
+        }
+        for trace in make_figure(subset).data:
+            built[owner[trace.name]].append(trace.to_plotly_json())
+        store.update(built)
+    return {country: store[country] for country in countries}
+
+
+class LineChart:
+    """The figure of one line view in one session, patched per country."""
+
+    def __init__(self, view, data_version, layout):
+        self.view = view
+        self.data_version = data_version
+        self.figure = go.Figure(layout=layout)
+        self.traces = {}  # Country -> its traces in self.figure, in selection order
+        self.colors = {}  # Country -> color, kept while it stays selected
+
+    def _color(self):
+        used = set(self.colors.values())
+        free = [color for color in PALETTE if color not in used]
+        return free[0] if free else PALETTE[len(self.colors) % len(PALETTE)]
+
+    def update(self, frame, countries):
+        """Adds and removes traces so that the figure shows the given countries. Returns (added, removed)."""
+        removed = [country for country in self.traces if country not in countries]
+        added = [country for country in dict.fromkeys(countries) if country not in self.traces]
+
+        if removed:
+            dropped = {id(trace) for country in removed for trace in self.traces.pop(country)}
+            self.figure.data = [trace for trace in self.figure.data if id(trace) not in dropped]
+            for country in removed:
+                del self.colors[country]
+
+        if added:
+            built = _country_traces(frame, self.view, self.data_version, added)
+            traces = []
+            for country in added:
+                color = self.colors[country] = self._color()
+                traces.append([
+                    {**trace, "line": {**trace.get("line", {}), "color": color},
+                     "marker": {**trace.get("marker", {}), "color": color}}
+                    for trace in built[country]
+                ])
+            count = len(self.figure.data)
+            self.figure.add_traces([trace for country_traces in traces for trace in country_traces])
+            for country, country_traces in zip(added, traces):
+                self.traces[country] = self.figure.data[count:count + len(country_traces)]
+                count += len(country_traces)
+        return added, removed
+
+
+def line_chart(view, frame, countries):
+    """
+    The session's figure of the view, updated to the selected countries.
+    The Figure belongs to the session; it is patched again on the next call.
+    """
+    dataset = LINE_VIEWS[view][0]
+    data_version = bundle.dataset_hash(dataset)
+    key = f"_line_chart:{view}"
+    chart = st.session_state.get(key)
+    with span("figure", chart=view) as attrs:
+        if chart is None or chart.data_version != data_version:
+            chart = st.session_state[key] = LineChart(view, data_version, _layout(frame, view, data_version))
+        added, removed = chart.update(frame, countries)
+        attrs["added"], attrs["removed"] = len(added), len(removed)
+    return chart.figure
+
+
+def clear_line_charts():
+    """Drops the shared per-country traces (after their datasets changed)."""
+    _row_groups.clear()
+    _layout.clear()
+    _trace_store.clear()
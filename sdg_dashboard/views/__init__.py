@@ -0,0 +1,8 @@
+"""
+The pages of the app, one module per page and dashboard view.
+
+Each module has a ``render()`` that draws its page. The router
+(router.py) imports a module the first time a session is routed to it,
+so a process only imports the pages, and their plotting and data stack,
+that are actually visited, and a rerun executes only the active page.
+"""
@@ -0,0 +1,42 @@
+"""
+Brazil Germany Comparison: income percentiles and energy expenditure (prebuilt figures).
+"""
+
+import streamlit as st
+
+from sdg_dashboard import router
+from sdg_dashboard.figures import plotly_chart, static_figure
+
+
+def render():
+    # Vorab erstellte Diagramme aus dem Daten-Bundle (siehe sdg_dashboard/build.py)
+    fig_linear = static_figure("income_linear")
+    fig_log = static_figure("income_log")
+
+    if fig_linear is not None and fig_log is not None:
+        # --- Zwei Diagramme nebeneinander platzieren ---
+        col1, col2 = st.columns(2)
+        with col1:
+            plotly_chart(fig_linear, use_container_width=True)
+        with col2:
+            plotly_chart(fig_log, use_container_width=True)
+
+        st.markdown("---")  # Trennlinie vor dem Balkendiagramm
+
+    # Balkendiagramm der Energieausgaben
+    fig = static_figure("energy_expenditure")
+    if fig is not None:
+        st.title("Comparison of Per Capita Energy Expenditure Between Brazil and Germany")
+        plotly_chart(fig, use_container_width=True)
+
+        st.markdown("""
+        The graph shows income percentiles, which divide the population into equal 10% groups based on income levels. 
+        It compares the percentage of income spent on electricity in Brazil and Germany for each percentile group.
+        """)
+    else:
+        st.warning("No data available for Brazil Germany Comparison.")
+
+    # Button zum Weiterklicken (bleibt wie gehabt)
+    with st.sidebar:
+        st.write("---")
+        router.nav_button("Proceed to results", router.RESULTS, key="proceed_to_results_brazil_germany")
@@ -0,0 +1,19 @@
+"""
+Dashboards page: the view chosen in the sidebar (see router.VIEW_MODULES).
+"""
+
+import streamlit as st
+
+from sdg_dashboard import router
+
+
+def render():
+    # INDICATOR DASHBOARD
+    st.sidebar.header("Dashboard Selection")
+    dashboard_choice = st.sidebar.radio(
+        "Choose a dashboard:",
+        options=list(router.VIEW_MODULES),
+        index=0,
+        key="dashboard_choice"
+    )
+    router.render_view(dashboard_choice)
@@ -0,0 +1,50 @@
+"""
+Data Availability: share of the UN member states with data per SDG,
+computed from the loaded datasets (see availability.py).
+"""
+
+import streamlit as st
+
+from sdg_dashboard import availability, router
+from sdg_dashboard.figures import availability_figure, plotly_chart
+
+BREAKDOWN_OPTIONS = {"Per goal": None, "By year": "Year", "By region": "Region"}
+
+# What the percentage means per breakdown
+DESCRIPTIONS = {
+    None: f"the percentage of {availability.UN_MEMBER_STATES} UNO Member States for which data exists for each "
+          "Sustainable Development Goal, averaged over the indicators of the goal in the SDR 2024 database",
+    "Year": f"the percentage of {availability.UN_MEMBER_STATES} UNO Member States with a score for each "
+            "Sustainable Development Goal in the SDG index of that year",
+    "Region": "the percentage of a region's UNO Member States for which data exists for each "
+              "Sustainable Development Goal, averaged over the indicators of the goal in the SDR 2024 database",
+}
+
+
+def render():
+    st.title("Data Availability of UNO Member States")
+
+    # Jede Ansicht braucht nur ihre eigenen Daten: die Aufschlüsselung nach Jahr
+    # kommt ohne die Full Database aus (nur sdg_index)
+    options = list(BREAKDOWN_OPTIONS)
+    default = next((i for i, option in enumerate(options) if availability.has_data(BREAKDOWN_OPTIONS[option])), 0)
+    choice = st.radio("Breakdown", options, index=default, horizontal=True, key="availability_breakdown")
+    breakdown = BREAKDOWN_OPTIONS[choice]
+    data_availability = availability.BREAKDOWNS[breakdown]()
+
+    if data_availability is not None and not data_availability.empty:
+        plotly_chart(availability_figure(data_availability, breakdown), use_container_width=True)
+        median_availability = data_availability["Data Availability (%)"].median()
+
+        st.markdown(f"""
+        **Data availability** indicates {DESCRIPTIONS[breakdown]}.  
+        **Median Data Availability:** {median_availability:.2f}%
+        """)
+    else:
+        source = "the SDG index" if breakdown == "Year" else "the SDR 2024 Full Database"
+        st.warning(f"Data availability could not be computed: {source} is missing.")
+
+    # Add the proceed button in the sidebar
+    with st.sidebar:
+        st.write("---")
+        router.nav_button("Proceed to results", router.RESULTS, key="proceed_to_results_electricity")
@@ -0,0 +1,50 @@
+"""
+Electricity Loss Comparison: transmission and distribution losses per country.
+"""
+
+import os
+
+import streamlit as st
+
+from sdg_dashboard import router
+from sdg_dashboard.figures import plotly_chart
+from sdg_dashboard.traces import line_chart
+
+VIEW = "Electricity Loss Comparison"
+
+
+def render():
+    elecloss2_data = router.page_data(router.DASHBOARDS, VIEW)["elecloss2"]  # Long layout, one row per country and year
+    if elecloss2_data is None:
+        st.stop()
+    st.sidebar.header("Select Countries for Electricity Loss")
+    countries = sorted(elecloss2_data["Country Name"].dropna().unique())
+    selected_countries = st.sidebar.multiselect(
+        "Choose up to two countries to compare:",
+        options=countries,
+        default=["Brazil", "Germany", "World"]
+    )
+
+    if st.sidebar.button("Generate Comparison"):
+        # Session figure, patched with the traces of added/removed countries only
+        fig = line_chart("electricity loss", elecloss2_data, selected_countries)
+        plotly_chart(fig, use_container_width=True)
+
+        image_path = "assets/brazil.jpg"
+        if os.path.exists(image_path):
+            st.image(image_path, caption="Energy Grid in Favelas", use_container_width=True)
+            st.markdown(
+                """
+                <p style="text-align: center; font-size: 14px; margin-top: 10px;">
+                <a href="https://rioonwatch.org/?p=63431" target="_blank" style="text-decoration: none; color: #3498db;">
+                Learn more about the energy grid in favelas here.
+                </a>
+                </p>
+                """,
+                unsafe_allow_html=True
+            )
+        else:
+            st.warning("The image could not be loaded. Please ensure the file 'brazil.jpg' exists in the 'assets' directory.")
+
+    elif not selected_countries:
+        st.warning("Please select at least one country for the comparison.")
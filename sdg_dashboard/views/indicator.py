@@ -0,0 +1,144 @@
+"""
+Indicator Dashboard: the Goal 7 indicators for the selected countries.
+"""
+
+import plotly.express as px
+import streamlit as st
+
+from sdg_dashboard import router
+from sdg_dashboard.figures import plotly_chart
+from sdg_dashboard.metrics import span
+from sdg_dashboard.traces import INDICATOR_CHARTS, line_chart
+
+VIEW = "Indicator Dashboard"
+
+
+def render():
+    goal7_data = router.page_data(router.DASHBOARDS, VIEW)["goal7"]  # Indicator names are stripped at build time
+    if goal7_data is None:
+        st.stop()
+
+    # Sidebar for selecting indicators and countries
+    st.sidebar.header("Select Indicator and Countries")
+    indicators = sorted(goal7_data["Indicator"].unique())
+    selected_indicator = st.sidebar.selectbox("Choose an indicator:", options=indicators)
+    countries = sorted(goal7_data["GeoAreaName"].unique())
+    selected_countries = st.sidebar.multiselect("Choose countries to compare:", options=countries, default=["Brazil", "Germany"])
+
+    if st.sidebar.button("Generate Indicator Graph"):
+        if selected_indicator in INDICATOR_CHARTS:
+            # Session figure, patched with the traces of added/removed countries only
+            fig = line_chart(f"indicator {selected_indicator}", goal7_data, selected_countries)
+            has_data = bool(fig.data)
+        else:
+            with span("filter", dataset="goal7", indicator=selected_indicator, countries=len(selected_countries)):
+                filtered_data = goal7_data[
+                    (goal7_data["Indicator"] == selected_indicator) &
+                    (goal7_data["GeoAreaName"].isin(selected_countries))
+                ]
+            has_data = not filtered_data.empty
+
+        st.title("Indicator Dashboard")
+        if has_data:
+            if selected_indicator == "7.1.1":
+                st.markdown("### Indicator 7.1.1: Proportion of population with access to electricity, by urban/rural (%)")
+                plotly_chart(fig, use_container_width=True)
+                st.markdown("Access to electricity is the percentage of population with access to electricity. Electrification data are collected from industry, national surveys and international sources.")
+
+            elif selected_indicator == "7.1.2":
+                st.markdown("### Indicator 7.1.2: Proportion of population with primary reliance on clean fuels and technology (%)")
+                plotly_chart(fig, use_container_width=True)
+                st.markdown("The proportion of population with primary reliance on clean fuels and technology is calculated as the number of people using clean fuels and technologies for cooking, heating and lighting divided by total population reporting that any cooking, heating or lighting, expressed as percentage.")
+
+            elif selected_indicator == "7.2.1":
+                st.markdown("### Indicator 7.2.1: Renewable energy share in the total final energy consumption (%)")
+                plotly_chart(fig, use_container_width=True)
+                st.markdown("Renewable energy consumption is the share of renewables energy in total final energy consumption.")
+
+            elif selected_indicator == "7.3.1":
+                st.markdown("### Indicator 7.3.1: Energy intensity level of primary energy (megajoules per constant 2017 purchasing power parity GDP)")
+                plotly_chart(fig, use_container_width=True)
+                st.markdown("Energy intensity level of primary energy is the ratio between energy supply and gross domestic product measured at purchasing power parity.")
+
+            elif selected_indicator == "7.a.1":
+                st.markdown("### Indicator 7.a.1: Financial flows to developing countries in support of clean energy research and development")
+                st.markdown("Financial flows include official loans, grants, and equity investments received by countries from foreign governments and multilateral agencies, for the purpose of clean energy research and development and renewable energy production.")
+
+                # Efficient visualization of overall trends for 7.a.1
+                if "Type of renewable technology" in filtered_data.columns:
+                    overview_data = filtered_data.groupby(["TimePeriod", "GeoAreaName"], observed=True)["Value"].sum().reset_index()
+                    with span("figure", chart="Overall Financial Flow Trends (7.a.1)"):
+                        fig_overview = px.area(
+                            overview_data,
+                            x="TimePeriod",
+                            y="Value",
+                            color="GeoAreaName",
+                            title="Overall Financial Flow Trends (7.a.1)",
+                            labels={"TimePeriod": "Year", "Value": "Total Financial Flows (in Units)"},
+                        )
+                        fig_overview.update_layout(template="plotly_white")
+                    plotly_chart(fig_overview, use_container_width=True)
+
+                    for technology in filtered_data["Type of renewable technology"].unique():
+                        tech_data = filtered_data[filtered_data["Type of renewable technology"] == technology]
+                        tech_data = tech_data.sort_values("TimePeriod").reset_index(drop=True)
+
+                        with span("figure", chart=f"{technology} Trends (7.a.1)"):
+                            fig = px.bar(
+                                tech_data,
+                                x="TimePeriod",
+                                y="Value",
+                                color="GeoAreaName",
+                                barmode="group",
+                                title=f"{technology} Trends (7.a.1)",
+                                labels={"TimePeriod": "Year", "Value": "Value (in Units)"}
+                            )
+                            fig.update_layout(template="plotly_white")
+                        plotly_chart(fig, use_container_width=True)
+                else:
+                    st.error("The column 'Type of renewable technology' is missing in the data.")
+
+            elif selected_indicator == "7.b.1":
+                st.markdown("### Indicator 7.b.1: Installed renewable electricity-generating capacity (watts per capita)")
+                st.markdown("The indicator is defined as the installed capacity of power plants that generate electricity from renewable energy sources divided by the total population of a country.")
+
+                # Efficient visualization of overall trends for 7.b.1
+                if "Type of renewable technology" in filtered_data.columns:
+                    overview_data = filtered_data.groupby(["TimePeriod", "GeoAreaName"], observed=True)["Value"].sum().reset_index()
+                    with span("figure", chart="Overall Installed Capacity Trends (7.b.1)"):
+                        fig_overview = px.area(
+                            overview_data,
+                            x="TimePeriod",
+                            y="Value",
+                            color="GeoAreaName",
+                            title="Overall Installed Capacity Trends (7.b.1)",
+                            labels={"TimePeriod": "Year", "Value": "Installed Capacity (in Watts per Capita)"},
+                        )
+                        fig_overview.update_layout(template="plotly_white")
+                    plotly_chart(fig_overview, use_container_width=True)
+
+                    for technology in filtered_data["Type of renewable technology"].unique():
+                        tech_data = filtered_data[filtered_data["Type of renewable technology"] == technology]
+                        tech_data = tech_data.sort_values("TimePeriod").reset_index(drop=True)
+
+                        with span("figure", chart=f"{technology} Trends (7.b.1)"):
+                            fig = px.bar(
+                                tech_data,
+                                x="TimePeriod",
+                                y="Value",
+                                color="GeoAreaName",
+                                barmode="group",
+                                title=f"{technology} Trends (7.b.1)",
+                                labels={"TimePeriod": "Year", "Value": "Value (in Units)"}
+                            )
+                            fig.update_layout(template="plotly_white")
+                        plotly_chart(fig, use_container_width=True)
+                else:
+                    st.error("The column 'Type of renewable technology' is missing in the data.")
+
+        else:
+            st.write("No data available for the selected indicator and countries.")
+
+    # Button to proceed to results
+    st.sidebar.write("---")
+    router.nav_button("Proceed to results", router.RESULTS, container=st.sidebar, key="proceed_to_results_button")
@@ -0,0 +1,66 @@
+"""
+Results page: the stored survey answers and the reflection questions.
+"""
+
+import streamlit as st
+
+from sdg_dashboard import router
+from sdg_dashboard.answers import load_answers
+
+
+def render():
+    # RESULTS PAGE
+    st.title("Results")
+    st.markdown("### Here are the responses you've provided:")
+
+    # Lade gespeicherte Daten, falls vorhanden
+    answers = load_answers()
+    for idx, answer in enumerate(answers):
+        st.write(f"**Response {idx + 1}:**")
+        st.write(f"- Reliability Score: {answer['reliability_score']}")
+        st.write(f"- SDG Knowledge Score: {answer['sdg_knowledge_score']}")
+
+    # Add a reflective section for the user
+    st.markdown(
+        """
+        <h1 style="text-align: center; color: #2c3e50; margin-top: 50px;">Reflection on SDG Composition</h1>
+        <p style="text-align: center; font-size: 16px; color: #7f8c8d;">After exploring the SDG dashboard, reflect on the following questions:</p>
+        """,
+        unsafe_allow_html=True,
+    )
+
+    # Reflective Question 1: How has your perception of SDGs changed?
+    st.markdown("#### 1. How has your perception of the SDGs changed after using this dashboard?")
+    perception_slider = st.slider(
+        label="Select the extent of change in your perception:",
+        min_value=0,
+        max_value=10,
+        value=5,
+        step=1,
+        help="0 means your perception hasn't changed at all, 10 means your perception has completely changed."
+    )
+
+    # Reflective Question 2: How do you feel about the reliability of SDGs now?
+    st.markdown("#### 2. How reliable do you now find SDG scores in measuring progress?")
+    reliability_slider = st.slider(
+        label="Rate the reliability again (0 = not reliable at all, 10 = very reliable):",
+        min_value=0,
+        max_value=10,
+        value=5,
+        step=1,
+        help="Rate how reliable you feel SDG scores are after exploring the dashboard."
+    )
+
+    # Reflective Question 3: How likely are you to use SDG scores in arguments?
+    st.markdown("#### 3. How likely are you to use SDG scores to argue about progress in sustainable development?")
+    likelihood_slider = st.slider(
+        label="Rate your likelihood (0 = very unlikely, 10 = very likely):",
+        min_value=0,
+        max_value=10,
+        value=5,
+        step=1,
+        help="Rate how likely you are to reference SDG scores in discussions or arguments about sustainability."
+    )
+
+    # Add a button to return to the main dashboard
+    router.nav_button("Return to Dashboard", router.DASHBOARDS)
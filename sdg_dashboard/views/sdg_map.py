@@ -0,0 +1,169 @@
+"""
+SDG map: status of every country per SDG, with the trend of the selected country.
+"""
+
+import streamlit as st
+from streamlit_plotly_events import plotly_events
+
+from sdg_dashboard import router
+from sdg_dashboard.data import load_country_index, load_icons
+from sdg_dashboard.figures import (
+    COLOR_HEX_MAPPING, SDG_LABELS, STATUS_DESCRIPTIONS, TREND_DESCRIPTIONS,
+    generate_map, payload_size, sdg_columns,
+)
+from sdg_dashboard.icons import icon_width
+from sdg_dashboard.map_index import country_from_click
+from sdg_dashboard.metrics import reporting_enabled, span
+
+
+def select_sdg(index):
+    """on_click of the SDG buttons: runs before the click's rerun, which then shows the SDG."""
+    st.session_state.selected_sdg_index = index
+
+
+def render():
+    # Initialize session state
+    if "selected_sdg_index" not in st.session_state:
+        st.session_state.selected_sdg_index = 0
+
+    # Lade SDG-Daten (nur das Blatt "Overview")
+    color_data = router.page_data(router.SDG_MAP)["sdr2024"]
+    if color_data is not None:
+        # Identify SDG and trend columns
+        color_columns, trend_columns = sdg_columns(color_data)
+        st.write("SDG Dashboard Placeholder")
+    else:
+        st.error("SDG data is not available.")
+        st.stop()
+
+    # SDG labels, color and trend mappings (shared with the static export)
+    sdg_labels = SDG_LABELS
+    color_mapping = STATUS_DESCRIPTIONS
+    color_hex_mapping = COLOR_HEX_MAPPING
+    trend_mapping = TREND_DESCRIPTIONS
+
+    # Layout: Instructions, Map, Legend
+    header_cols = st.columns([1.5, 4, 1.5])
+
+    with header_cols[0]:
+        st.markdown("## Instructions")
+        st.write("""
+        1. Select an SDG by clicking the button above its icon below the map.
+        2. View the map to see the global performance for the selected SDG.
+        3. Click a country on the map or use the dropdown under the legend to view its trend.
+        """)
+
+        # Add the Tip for the user
+        st.markdown("## Tip")
+        st.write("""
+        Have a look at Brazil's performance at the SDG 7. Did you expect that?
+        """)
+
+        st.markdown("## Bias")
+        with st.expander("Read more about Bias..."):
+            st.write("""
+            The data presented here is aggregated from various global sources and may include uncertainties. 
+            Factors such as data quality, collection methods, and regional differences in reporting standards 
+            could introduce biases. Interpret trends and performance cautiously, acknowledging these limitations.
+
+            The data we introduce may construct a narrative. As we cannot include all existing data in the current version, 
+            we decided to provide the data that creates contrast and serves the investigation of our leading question. 
+            This is undeterrable and induced by selective bias.
+            """)
+
+    # The map and the legend/trend panel are fragments: a widget inside one of
+    # them only reruns that fragment. Changes that affect the other parts
+    # (clicked country, navigation) rerun the whole app. The SDG strip is not a
+    # fragment: a new SDG changes the map and the legend, so its buttons set
+    # the SDG in on_click and the click's own rerun redraws everything.
+    @st.fragment
+    def map_panel():
+        st.markdown("<h2 style='text-align: center; margin-bottom: 10px;'>Global SDG Performance</h2>", unsafe_allow_html=True)
+        with span("figure", chart="SDG map"):
+            fig = generate_map(st.session_state.selected_sdg_index)
+        with span("plotly_chart", chart="SDG map") as attrs:
+            if reporting_enabled():
+                attrs["bytes"] = payload_size(fig)
+            clicked_points = plotly_events(fig, click_event=True, override_height=450, key="map_click")
+
+        # A click on the map selects the country for the trend panel
+        if clicked_points and clicked_points != st.session_state.get("last_map_click"):
+            st.session_state.last_map_click = clicked_points
+            known_countries = color_data["Country"].unique()
+            clicked_country = country_from_click(clicked_points[0], fig, load_country_index(), known_countries)
+            if clicked_country in known_countries:
+                st.session_state.country_dropdown = clicked_country
+                st.rerun()
+
+    @st.fragment
+    def legend_panel():
+        st.markdown("## Legend")
+        for color, description in color_mapping.items():
+            st.markdown(
+                f"<div style='display: flex; align-items: center;'>"
+                f"<div style='background-color: {color_hex_mapping[color]}; width: 20px; height: 20px; margin-right: 10px;'></div>"
+                f"<span style='font-size: 14px;'>{description}</span></div>",
+                unsafe_allow_html=True
+            )
+
+        # Add country selection dropdown and current situation display
+        st.markdown("<div style='margin-top: 50px;'>", unsafe_allow_html=True)
+        selected_sdg_label = sdg_labels[st.session_state.selected_sdg_index]
+        st.markdown(f"### Trend for {selected_sdg_label}")
+
+        selected_country = st.selectbox("Select a country:", options=color_data["Country"].unique(), key="country_dropdown")
+
+        if selected_country:
+            current_sdg = color_columns[st.session_state.selected_sdg_index]
+            if current_sdg in color_data.columns:
+                country_data = color_data[color_data["Country"] == selected_country]
+                if not country_data.empty:
+                    country_color = country_data.iloc[0][current_sdg]
+                    color_description = color_mapping.get(country_color, "No description available.")
+                    color_hex = color_hex_mapping.get(country_color, "#808080")
+                    st.markdown(f"""
+                        <div style='display: flex; align-items: center; margin-top: 10px;'>
+                            <div style='background-color: {color_hex}; width: 20px; height: 20px; margin-right: 10px;'></div>
+                            <span style='font-size: 16px;'>{color_description}</span>
+                        </div>
+                    """, unsafe_allow_html=True)
+
+            # Fetch and display trend
+            trend_column = trend_columns[st.session_state.selected_sdg_index]
+            if trend_column in color_data.columns:
+                trend_data = color_data[color_data["Country"] == selected_country]
+                if not trend_data.empty:
+                    trend = trend_data.iloc[0][trend_column]
+                    trend_description = trend_mapping.get(str(trend).strip(), "No trend description available.")
+                    st.markdown(f"""
+                        <div style='display: flex; align-items: center;'>
+                            <span style='font-size: 24px; margin-right: 10px;'>{trend}</span>
+                            <span style='font-size: 16px;'>{trend_description}</span>
+                        </div>
+                    """, unsafe_allow_html=True)
+
+    # SDG selection section
+    def sdg_strip():
+        cols = st.columns(len(sdg_labels))
+        sdg_icons = load_icons()
+
+        for i, col in enumerate(cols):
+            with col:
+                st.button(f"SDG {i + 1}", key=f"sdg_button_{i}", on_click=select_sdg, args=(i,))
+
+                if sdg_icons[i] is not None:
+                    st.image(sdg_icons[i], use_container_width=False, width=icon_width(i))
+
+    with header_cols[1]:
+        map_panel()
+
+    with header_cols[2]:
+        legend_panel()
+
+        # Add Proceed button under the Trend display. Outside the fragment, so
+        # that the click reruns the whole app (once) and shows the new page
+        st.markdown("<div style='margin-top: 20px;'></div>", unsafe_allow_html=True)
+        router.nav_button("Proceed to Indicator Dashboard", router.DASHBOARDS, key="new_dashboard_button")
+
+    st.write("---")
+    sdg_strip()
@@ -0,0 +1,87 @@
+"""
+Landing page: the survey about the reliability of SDG scores.
+"""
+
+import streamlit as st
+
+from sdg_dashboard import router
+from sdg_dashboard.answers import save_answer
+
+
+# Antworten speichern, bevor die Umfrage verlassen wird
+def submit_survey():
+    save_answer(st.session_state.reliability_input, st.session_state.sdg_knowledge_input)
+    st.session_state.reliability_score = st.session_state.reliability_input
+    st.session_state.sdg_knowledge_score = st.session_state.sdg_knowledge_input
+
+
+def render():
+    st.markdown(
+        """
+        <h1 style="text-align: center; color: #2c3e50; margin-top: 50px;">How reliable are SDG scores in measuring sustainable development progress?</h1>
+        <p style="text-align: center; font-size: 16px; color: #7f8c8d;">Please rate on a scale from 1 to 10, where 10 is the most reliable.</p>
+        """,
+        unsafe_allow_html=True,
+    )
+
+    # Slider for reliability score
+    st.slider(
+        label="Rate the reliability:",
+        min_value=1,
+        max_value=10,
+        value=5,
+        step=1,
+        help="Drag the slider to indicate your opinion on the reliability of SDG scores.",
+        key="reliability_input"
+    )
+
+    # Second question with slider
+    st.markdown(
+        """
+        <h1 style="text-align: center; color: #2c3e50; margin-top: 30px;">How would you rate your knowledge about the composition of SDGs?</h1>
+        <p style="text-align: center; font-size: 16px; color: #7f8c8d;">Please rate on a scale from 1 to 10, where 10 means you have excellent knowledge.</p>
+        """,
+        unsafe_allow_html=True,
+    )
+
+    # Slider for SDG knowledge
+    st.slider(
+        label="Rate your knowledge:",
+        min_value=1,
+        max_value=10,
+        value=5,
+        step=1,
+        help="Drag the slider to indicate your knowledge about the concept of SDGs.",
+        key="sdg_knowledge_input"
+    )
+
+    # Two columns: Guideline on the left, Bias on the right
+    guideline_col, bias_col = st.columns(2)
+
+    with guideline_col:
+        st.write("---")
+        st.markdown("## Introduction")
+        st.write("""
+        In the context of sustainability we always talk about the Sustainable Development Goals (SDGs). 
+        We accept their apparent importance and rarely scrutinize them. 
+
+        Therefore we want to enable you to gain a deeper understanding of the SDGs, how they are constructed, 
+        and what their weaknesses are.
+        """)
+
+    with bias_col:
+        st.write("---")
+        st.markdown("## Bias")
+        with st.expander("Read more about Bias..."):
+            st.write("""
+            The data presented here is aggregated from various global sources and may include uncertainties. 
+            Factors such as data quality, collection methods, and regional differences in reporting standards 
+            could introduce biases. Interpret trends and performance cautiously, acknowledging these limitations.
+
+            The data we introduce may construct a narrative. As we cannot include all existing data in the current version, 
+            we decided to provide the data that creates contrast and serves the investigation of our leading question. 
+            This is undeterrable and induced by selective bias.
+            """)
+
+    # Large Proceed button; saves the answers and opens the map in the same rerun
+    router.nav_button("Proceed to SDG Dashboard", router.SDG_MAP, before=submit_survey, key="proceed_button")
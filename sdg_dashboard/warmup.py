@@ -0,0 +1,150 @@
+"""
+Background warm-up of the dataset caches.
+
+``start()`` fills every cached loader (in parallel, see registry.py), the
+map index, the SDG icons, the 17 SDG maps and the prebuilt figures in a
+daemon thread, so the first visitor after a deploy does not pay for parsing
+the workbooks. Readiness is reported in two optional ways
+for a load balancer or health check:
+
+- ``SDG_READY_FILE``: path of a file that is created once the process is warm
+- ``SDG_READY_PORT``: port of a small HTTP endpoint; ``GET /ready`` answers
+  200 when warm and 503 (with the per-step status as JSON) before that
+
+The process is only warm if every dataset loaded and every step succeeded.
+A dataset missing from the bundle, or a map or figure that could not be
+built, fails its step and the process stays not ready.
+
+Setting ``SDG_WARMUP=0`` disables the warm-up (used by the benchmarks).
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from streamlit import runtime
+
+from sdg_dashboard import data, figures, registry
+
+_LOGGER = logging.getLogger(__name__)
+
+# Seconds to wait for the Streamlit runtime before warming anyway
+RUNTIME_TIMEOUT = 30
+
+READY = threading.Event()
+
+_lock = threading.Lock()
+_thread = None
+_status = {}
+
+
+def _warm_sdg_maps():
+    maps = [figures.generate_map(i) for i in range(figures.SDG_COUNT)]
+    return None if None in maps else maps
+
+
+def _warm_static_figures():
+    static = [figures.static_figure(name) for name in figures.STATIC_FIGURES]
+    return None if None in static else static
+
+
+# Derived from the datasets, built after they are loaded; a step fails if it returns None
+WARMUP_STEPS = [
+    ("country index", data.load_country_index),
+    ("SDG icons", data.load_icons),
+    ("SDG maps", _warm_sdg_maps),
+    ("static figures", _warm_static_figures),
+]
+
+
+def _wait_for_runtime():
+    # Caches created before the runtime exists would not use its storage
+    deadline = time.monotonic() + RUNTIME_TIMEOUT
+    while not runtime.exists() and time.monotonic() < deadline:
+        time.sleep(0.1)
+
+
+def _run():
+    _wait_for_runtime()
+
+    started = time.perf_counter()
+    errors = registry.load_all()
+    for name, error in errors.items():
+        if error is None:
+            _status[name] = {"ok": True}
+        else:
+            _status[name] = {"ok": False, "error": str(error)}
+            _LOGGER.warning("Warm-up of dataset %s failed: %s", name, error)
+    _status["datasets"] = {
+        "ok": all(error is None for error in errors.values()),
+        "seconds": round(time.perf_counter() - started, 3),
+    }
+
+    for name, step in WARMUP_STEPS:
+        started = time.perf_counter()
+        try:
+            if step() is None:
+                raise LookupError("not available in the data bundle")
+            _status[name] = {"ok": True, "seconds": round(time.perf_counter() - started, 3)}
+        except Exception as exc:  # A missing file must not stop the remaining steps
+            _status[name] = {"ok": False, "error": str(exc)}
+            _LOGGER.warning("Warm-up step %s failed: %s", name, exc)
+
+    if not all(step["ok"] for step in _status.values()):
+        _LOGGER.warning("Warm-up failed, not ready: %s", _status)
+        return
+    READY.set()
+    ready_file = os.environ.get("SDG_READY_FILE")
+    if ready_file:
+        with open(ready_file, "w") as file:
+            json.dump(_status, file, indent=4)
+    _LOGGER.info("Warm-up finished: %s", _status)
+
+
+class _ReadinessHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path.rstrip("/") != "/ready":
+            self.send_error(404)
+            return
+        body = json.dumps({"ready": READY.is_set(), "steps": _status}).encode()
+        self.send_response(200 if READY.is_set() else 503)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def _serve_readiness(port):
+    server = ThreadingHTTPServer(("", port), _ReadinessHandler)
+    threading.Thread(target=server.serve_forever, name="sdg-readiness", daemon=True).start()
+
+
+def start():
+    """Starts the warm-up once per process; later calls do nothing."""
+    global _thread
+    with _lock:
+        if _thread is not None or os.environ.get("SDG_WARMUP") == "0":
+            return
+        ready_file = os.environ.get("SDG_READY_FILE")
+        if ready_file and os.path.exists(ready_file):
+            os.remove(ready_file)  # Left over from a previous process
+        port = os.environ.get("SDG_READY_PORT")
+        if port:
+            _serve_readiness(int(port))
+        _thread = threading.Thread(target=_run, name="sdg-warmup", daemon=True)
+        _thread.start()
+
+
+def is_ready():
+    return READY.is_set()
+
+
+def status():
+    """Per-step result of the warm-up: duration or error message."""
+    return dict(_status)
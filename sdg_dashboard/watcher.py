@@ -0,0 +1,160 @@
+"""
+Hot reload of changed datasets.
+
+A daemon thread polls every ``SDG_WATCH_INTERVAL`` seconds (default 2):
+
+- ``bundle/CURRENT``: when it names a new version, whether built by a
+  deploy, by ``python -m sdg_dashboard.build`` or by a development server,
+  only the datasets whose content hash changed are reloaded. Their stale
+  cache entries are dropped and the figures derived from them are rebuilt;
+  everything else stays cached;
+- only with ``SDG_WATCH_DATA=1`` (development): the source files of
+  ``Data/`` (mtime and size). When one changes, the bundle is rebuilt
+  incrementally (see build.py), which re-parses only the datasets whose
+  files changed.
+
+Rebuilding is off by default: the app only loads the bundle, and several
+server processes watching ``Data/`` would all race to build it. The build
+itself is serialized and prunes the versions it replaced.
+
+The loaders and figures are keyed by content hash, so sessions switch to
+the new data on their next rerun without a restart. Setting
+``SDG_WATCH=0`` disables the watcher.
+"""
+
+import logging
+import os
+import threading
+import time
+
+from sdg_dashboard import availability, build, bundle, data, figures, registry, traces
+from sdg_dashboard.cache import dataset_cache
+
+_LOGGER = logging.getLogger(__name__)
+
+INTERVAL = float(os.environ.get("SDG_WATCH_INTERVAL", "2"))
+
+
+def _rebuild_maps():
+    figures.clear_maps()
+    for i in range(figures.SDG_COUNT):
+        figures.generate_map(i)
+
+
+# Dataset -> figures and indexes built from it, rebuilt when it changes
+DEPENDENTS = {
+    "sdr2024": [_rebuild_maps, figures.clear_availability_figures],
+    "goal7": [traces.clear_line_charts],
+    "elecloss2": [traces.clear_line_charts],
+    "comparison_csvs": [figures.clear_static_figures],
+    "brazil_germany": [figures.clear_static_figures],
+    "sdg_index": [figures.clear_availability_figures],
+}
+
+# Loaders and tables outside the registry that read a dataset; loaded on
+# demand, so their stale entries are only dropped, not reloaded
+ON_DEMAND_LOADERS = {
+    "sdr2024": [data.load_sdr_full_database, availability.goal_coverage, availability.coverage_by_region],
+    "sdg_index": [availability.coverage_by_year],
+}
+
+_lock = threading.Lock()
+_thread = None
+
+
+def source_signature(data_dir=build.DATA_DIR):
+    """(mtime, size) of every source file of the bundle; missing files are None."""
+    signature = {}
+    for _, sources in build.DATASETS.values():
+        for name in sources:
+            try:
+                stat = os.stat(os.path.join(data_dir, name))
+                signature[name] = (stat.st_mtime_ns, stat.st_size)
+            except FileNotFoundError:
+                signature[name] = None
+    return signature
+
+
+def changed_datasets(old, new):
+    """Datasets whose content hash differs between two manifests."""
+    old_datasets = old.get("datasets", {})
+    new_datasets = new.get("datasets", {})
+    return sorted(
+        name for name in set(old_datasets) | set(new_datasets)
+        if old_datasets.get(name, {}).get("sha256") != new_datasets.get(name, {}).get("sha256")
+    )
+
+
+def reload(dataset):
+    """Drops the stale cache entries of a dataset, loads the new version and rebuilds its dependents."""
+    loader = registry.DATASETS[dataset]
+    version = bundle.dataset_hash(dataset)
+    dropped = dataset_cache.invalidate(loader.__name__, keep_version=version)
+    for on_demand in ON_DEMAND_LOADERS.get(dataset, []):
+        dropped += dataset_cache.invalidate(on_demand.__name__, keep_version=version)
+    started = time.perf_counter()
+    registry.load_all([dataset])
+    for rebuild in DEPENDENTS.get(dataset, []):
+        rebuild()
+    _LOGGER.info(
+        "Reloaded %s (%d stale entries dropped) in %.2f s", dataset, dropped, time.perf_counter() - started
+    )
+
+
+class BundleWatcher:
+    """Polls Data/ and the bundle; see the module docstring."""
+
+    def __init__(self, data_dir=build.DATA_DIR, interval=INTERVAL, rebuild=False):
+        self.data_dir = data_dir
+        self.interval = interval
+        self.rebuild = rebuild
+        self._sources = source_signature(data_dir) if rebuild else None
+        self._manifest = bundle.manifest()
+        self._stop = threading.Event()
+
+    def poll(self):
+        """One check for changes; returns the reloaded datasets."""
+        if self.rebuild:
+            sources = source_signature(self.data_dir)
+            if sources != self._sources:
+                self._sources = sources
+                _LOGGER.info("Source files in %s changed, rebuilding the bundle", self.data_dir)
+                try:
+                    build.build(self.data_dir, bundle.BUNDLE_DIR, log=_LOGGER.info)
+                except Exception as exc:  # Keep serving the current version
+                    _LOGGER.warning("Rebuilding the bundle failed: %s", exc)
+
+        current = bundle.manifest()
+        if current.get("version") == self._manifest.get("version"):
+            return []
+        changed = changed_datasets(self._manifest, current)
+        self._manifest = current
+        for dataset in changed:
+            if dataset in registry.DATASETS:
+                reload(dataset)
+        return changed
+
+    def run(self):
+        while not self._stop.wait(self.interval):
+            try:
+                self.poll()
+            except Exception:  # The watcher must keep running
+                _LOGGER.exception("Data watcher poll failed")
+
+    def stop(self):
+        self._stop.set()
+
+
+def _watch():
+    # Created in the thread: the first snapshot of Data/ stays off the page render
+    BundleWatcher(rebuild=os.environ.get("SDG_WATCH_DATA") == "1").run()
+
+
+def start():
+    """Starts the watcher once per process; later calls do nothing."""
+    global _thread
+    with _lock:
+        if _thread is not None or os.environ.get("SDG_WATCH") == "0":
+            return
+        _thread = threading.Thread(target=_watch, name="sdg-watcher", daemon=True)
+        _thread.start()
@@ -0,0 +1,20 @@
+"""
+Starts the dashboard with the cache warm-up running from process start.
+
+    python serve.py [streamlit run options]
+
+Same as ``streamlit run test.py``, but the dataset caches are filled in the
+background as soon as the server is up instead of on the first visit.
+See sdg_dashboard/warmup.py for the readiness file and endpoint.
+"""
+
+import sys
+
+from streamlit.web import cli
+
+from sdg_dashboard import warmup
+
+if __name__ == "__main__":
+    warmup.start()
+    sys.argv = ["streamlit", "run", "test.py", *sys.argv[1:]]
+    sys.exit(cli.main())
@@ -0,0 +1,55 @@
+import numpy as np
+
+from sdg_dashboard.downsample import downsample_indices, expand_gaps, lttb_indices
+
+
+def _series(n, nan_every):
+    x = np.arange(n, dtype=np.float64)
+    y = np.sin(x / 50)
+    y[nan_every - 1::nan_every] = np.nan
+    return x, y
+
+
+def test_lttb_keeps_first_and_last_point():
+    x = np.arange(1000, dtype=np.float64)
+    indices = lttb_indices(x, np.cos(x), 100)
+    assert len(indices) == 100
+    assert indices[0] == 0 and indices[-1] == 999
+    assert np.all(np.diff(indices) > 0)
+
+
+def test_lttb_threshold_two_keeps_endpoints():
+    assert lttb_indices(np.arange(10), np.arange(10), 2).tolist() == [0, 9]
+
+
+def test_lttb_short_series_unchanged():
+    assert lttb_indices(np.arange(5), np.arange(5), 10).tolist() == [0, 1, 2, 3, 4]
+
+
+def test_gaps_stay_within_threshold():
+    for nan_every in (4, 50, 1000):
+        x, y = _series(100_000, nan_every)
+        indices, gap_after = downsample_indices(x, y, 2000)
+        assert len(indices) <= 2000
+        assert np.isfinite(y[indices]).all()
+        assert np.all(np.diff(indices) > 0)
+        # A gap is marked exactly where a NaN lies between two kept points
+        nans = np.cumsum(np.isnan(y))
+        assert (gap_after[:-1] == (nans[indices[1:]] != nans[indices[:-1]])).all()
+        assert not gap_after[-1]
+
+
+def test_few_gaps_keep_every_run():
+    x, y = _series(10_000, 2_500)
+    indices, gap_after = downsample_indices(x, y, 500)
+    assert len(indices) <= 500
+    assert gap_after.sum() == 3
+    # The endpoints of every run of finite points survive
+    for point in (0, 2498, 2500, 4998, 5000, 7498, 7500, 9998):
+        assert point in indices
+
+
+def test_expand_gaps_repeats_the_point_before_a_gap():
+    expanded, nan_positions = expand_gaps(np.array([0, 3, 5, 9]), np.array([False, True, False, False]))
+    assert expanded.tolist() == [0, 3, 3, 5, 9]
+    assert nan_positions.tolist() == [2]